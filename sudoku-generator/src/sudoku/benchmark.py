@@ -10,6 +10,7 @@ import gc
 import statistics
 import psutil
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from contextlib import contextmanager
 from src.sudoku.generator import SudokuGenerator
 from src.sudoku.solver import SudokuSolver
@@ -174,6 +175,9 @@ def benchmark_solver(board_size=9, num_runs=5, profile=False):
     success_count = 0
     
     for _ in range(num_runs):
+        # Reuse the same generator for every run
+        generator.reset()
+        
         # Generate a complete board
         full_board = generator.generate_solution()
         
@@ -247,6 +251,9 @@ def benchmark_generator(board_size=9, num_clues=None, num_runs=3, max_attempts=N
     success_count = 0
     
     for _ in range(num_runs):
+        # Reuse the same generator for every run
+        generator.reset()
+        
         # Force garbage collection before benchmark
         gc.collect()
         
@@ -267,8 +274,7 @@ def benchmark_generator(board_size=9, num_clues=None, num_runs=3, max_attempts=N
                 end_time = time.time()
                 
                 # Verify the generated puzzle has the requested number of clues
-                filled_cells = sum(1 for row in range(board_size) for col in range(board_size) 
-                                  if not puzzle.is_empty(row, col))
+                filled_cells = board_size * board_size - puzzle.get_empty_count()
                 
                 if num_clues is None or filled_cells == num_clues:
                     success_count += 1
@@ -292,10 +298,43 @@ def benchmark_generator(board_size=9, num_clues=None, num_runs=3, max_attempts=N
     return result
 
 
-def run_comprehensive_benchmarks():
+def _solver_benchmark_summary(board_size, num_runs):
+    """
+    Run a solver benchmark and return its summary.
+    
+    Module-level so it can be submitted to a process pool.
+    """
+    return benchmark_solver(board_size, num_runs=num_runs).get_summary()
+
+
+def _generator_benchmark_summary(board_size, num_clues, num_runs, max_attempts, algorithm):
+    """
+    Run a generator benchmark and return its summary.
+    
+    Module-level so it can be submitted to a process pool.
+    """
+    return benchmark_generator(
+        board_size,
+        num_clues,
+        num_runs=num_runs,
+        max_attempts=max_attempts,
+        algorithm=algorithm
+    ).get_summary()
+
+
+def run_comprehensive_benchmarks(max_workers=1):
     """
     Run a comprehensive suite of benchmarks testing various board sizes and configurations.
     
+    By default the configurations run one at a time in a worker process. They
+    are independent, so more workers finish the suite sooner, but parallel
+    runs compete for CPU and memory bandwidth and inflate the reported times.
+    
+    Args:
+        max_workers (int, optional): Number of worker processes, passed to
+            ProcessPoolExecutor. Defaults to 1 so timings are not skewed by
+            contention; None uses one per CPU.
+    
     Returns:
         dict: Dictionary of benchmark results organized by category and configuration
     """
@@ -304,54 +343,77 @@ def run_comprehensive_benchmarks():
         "generator": {}
     }
     
-    # Benchmark solver for different board sizes with increased iterations
-    for size in [4, 9, 16]:
-        print(f"Benchmarking solver for {size}x{size} board...")
-        num_runs = 5 if size == 16 else 10  # Fewer runs for very large boards
-            
-        results["solver"][size] = benchmark_solver(size, num_runs=num_runs).get_summary()
-    
-    # Benchmark generator for different board sizes and configurations
-    for size, configs in [
-        (4, [{"num_clues": 12}]),
-        (9, [{"num_clues": 40}]),
-        (16, [{"num_clues": 192}])
-    ]:
-        results["generator"][size] = {}
-        
-        for config in configs:
-            config_name = f"{config['num_clues']}_clues"
-            print(f"Benchmarking generator for {size}x{size} board with {config_name}...")
-            
-            # Scale params based on board size
-            num_runs = 3 if size >= 16 else (5 if size >= 9 else 10)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Each future maps to (category, size, config_name, num_clues)
+        jobs = {}
+        
+        # Benchmark solver for different board sizes with increased iterations
+        for size in [4, 9, 16]:
+            num_runs = 5 if size == 16 else 10  # Fewer runs for very large boards
             
-            # Set increased max_attempts for larger boards
-            max_attempts = None
-            if size == 9:
-                max_attempts = 30  # Increased from default 10
-            elif size == 16:
-                max_attempts = 50  # Increased from default 15
+            # Reserve the slot so results keep submission order
+            results["solver"][size] = None
+            jobs[executor.submit(_solver_benchmark_summary, size, num_runs)] = (
+                "solver", size, None, None)
+        
+        # Benchmark generator for different board sizes and configurations
+        for size, configs in [
+            (4, [{"num_clues": 12}]),
+            (9, [{"num_clues": 40}]),
+            (16, [{"num_clues": 192}])
+        ]:
+            results["generator"][size] = {}
             
-            try:
+            for config in configs:
+                config_name = f"{config['num_clues']}_clues"
+                
+                # Scale params based on board size
+                num_runs = 3 if size >= 16 else (5 if size >= 9 else 10)
+                
+                # Set increased max_attempts for larger boards
+                max_attempts = None
+                if size == 9:
+                    max_attempts = 30  # Increased from default 10
+                elif size == 16:
+                    max_attempts = 50  # Increased from default 15
+                
                 # Use appropriate algorithm based on board size
                 algorithm = "basic" if size <= 4 else "optimized"
                 
-                # Try generating with timeout protection
-                results["generator"][size][config_name] = benchmark_generator(
-                    size, 
+                results["generator"][size][config_name] = None
+                job = executor.submit(
+                    _generator_benchmark_summary,
+                    size,
                     config["num_clues"],
-                    num_runs=num_runs,
-                    max_attempts=max_attempts,
-                    algorithm=algorithm
-                ).get_summary()
+                    num_runs,
+                    max_attempts,
+                    algorithm
+                )
+                jobs[job] = ("generator", size, config_name, config["num_clues"])
+        
+        print(f"Running {len(jobs)} benchmark configurations...")
+        if max_workers != 1:
+            print("Note: configurations run in parallel, so the reported "
+                  "timings include contention between them")
+        
+        # Report each configuration as it finishes, not when it is submitted
+        for job in as_completed(jobs):
+            category, size, config_name, num_clues = jobs[job]
+            if category == "solver":
+                results["solver"][size] = job.result()
+                print(f"Finished solver benchmark for {size}x{size} board")
+                continue
+            
+            try:
+                results["generator"][size][config_name] = job.result()
+                print(f"Finished generator benchmark for {size}x{size} board with {config_name}")
             except Exception as e:
                 print(f"Failed to benchmark {size}x{size} with {config_name}: {str(e)}")
                 # Record failure information in the results
                 results["generator"][size][config_name] = {
                     "error": str(e),
                     "board_size": size,
-                    "num_clues": config["num_clues"]
+                    "num_clues": num_clues
                 }
     
     return results
@@ -3,42 +3,262 @@ Board module for Sudoku generator.
 
 This module contains the Board class which represents a Sudoku grid.
 """
-import math
-from src.sudoku.cell import Cell
+import sys
+from src.sudoku.cell import Cell, DigitSet, _CellBase, _mask_of
+
+
+# Subgrid size for every supported board size: the perfect squares whose
+# digits fit in the one-byte value buffer, i.e. up to 15 * 15 = 225
+_SUBGRID_SIZES = {n * n: n for n in range(1, 16)}
+
+# _BIT[value] is the mask bit for a digit, 1 << (value - 1), looked up instead
+# of shifted on the hot paths. _BIT[0] is 0 so an empty cell adds no bit.
+_BIT = [0] + [1 << i for i in range(max(_SUBGRID_SIZES))]
+
+
+# Read-only lookup tables per board size, built on first use and shared by
+# every board of that size
+_TABLES = {}
+
+
+def _get_tables(size, subgrid_size):
+    """
+    Get the read-only lookup tables for a board size, building them once.
+    
+    Args:
+        size (int): Board size (n)
+        subgrid_size (int): Subgrid size (sqrt(n))
+        
+    Returns:
+        tuple: (box_of, box_origin, positions, peers) where box_of maps a flat
+               position (row * size + col) to its subgrid index, box_origin
+               maps a subgrid index to its top-left (row, col), positions
+               maps a flat position to its (row, col) tuple, and peers maps a
+               flat position to the flat positions sharing its row, column or
+               subgrid (excluding itself)
+    """
+    tables = _TABLES.get(size)
+    if tables is not None:
+        return tables
+    
+    box_of = tuple((row // subgrid_size) * subgrid_size + col // subgrid_size
+                   for row in range(size) for col in range(size))
+    box_origin = tuple((box_row * subgrid_size, box_col * subgrid_size)
+                       for box_row in range(subgrid_size)
+                       for box_col in range(subgrid_size))
+    positions = tuple((row, col) for row in range(size) for col in range(size))
+    peers = tuple(
+        tuple(other for other, (r, c) in enumerate(positions)
+              if other != index and (r == row or c == col or box_of[other] == box_of[index]))
+        for index, (row, col) in enumerate(positions)
+    )
+    
+    tables = _TABLES[size] = (box_of, box_origin, positions, peers)
+    return tables
+
+
+# __str__ formatting pieces per board size, built on first use
+_RENDER_PARTS = {}
+
+
+class _BoardCell(_CellBase):
+    """
+    Cell bound to a position on a board.
+    
+    The value and possible values are stored in the board's flat buffers;
+    this object only forwards reads and writes to them, so writing through a
+    cell keeps the board's constraint state consistent. Instances are
+    lightweight views created on demand by Board.get_cell() and hold only
+    their position and board.
+    """
+    
+    __slots__ = ('_board',)
+    
+    def __init__(self, board, row, col):
+        """
+        Initialize the cell.
+        
+        Args:
+            board (Board): Board that owns the cell's state
+            row (int): Row index (0-based)
+            col (int): Column index (0-based)
+        """
+        self._board = board
+        self.row = row
+        self.col = col
+    
+    @property
+    def _index(self):
+        """int: Flat position (row * size + col) in the board's buffers."""
+        return self.row * self._board.size + self.col
+    
+    @property
+    def value(self):
+        """int or None: The cell value, read from the board."""
+        return self._board._values[self._index] or None
+    
+    @value.setter
+    def value(self, value):
+        self._board.set_value(self.row, self.col, value)
+    
+    @property
+    def possible_values(self):
+        """DigitSet: Live view of the cell's candidate bitmask on the board."""
+        return DigitSet(self._board._candidates, self._index)
+    
+    @possible_values.setter
+    def possible_values(self, values):
+        self._board._candidates[self._index] = _mask_of(values)
+    
+    def num_possible(self):
+        """
+        Get the number of possible values for the cell.
+        
+        Returns:
+            int: Count of possible values, read as the popcount of the mask
+        """
+        return self._board._candidates[self._index].bit_count()
+    
+    def get_position(self):
+        """
+        Get the position of the cell as (row, col).
+        
+        Returns:
+            tuple: (row, column) position, shared from the board's position
+                   table rather than built per call
+        """
+        return self._board._positions[self._index]
+    
+    def copy(self):
+        """
+        Create a standalone copy of this cell, detached from the board.
+        
+        Returns:
+            Cell: A new Cell with the same position, value and possible values
+        """
+        index = self._index
+        board = self._board
+        new_cell = Cell(self.row, self.col, board._values[index] or None, board_size=board.size)
+        new_cell.possible_values = self.possible_values
+        return new_cell
+    
+    def set_value(self, value):
+        """
+        Set the value of the cell on its board.
+        
+        Args:
+            value (int or None): The new value for the cell.
+        """
+        self._board.set_value(self.row, self.col, value)
+
 
 class Board:
     """Represents a Sudoku board."""
     
+    # Fixed attribute layout: no per-instance __dict__, and attribute loads
+    # on the hot accessors resolve through slot descriptors.
+    __slots__ = ('size', 'subgrid_size', '_values', '_candidates', '_full_mask',
+                 '_box_of', '_box_origin', '_positions', '_peers',
+                 '_row_used', '_col_used', '_box_used',
+                 '_row_count', '_col_count', '_box_count',
+                 '_empty', '_empty_slot', '_str_cache', '_conflicts')
+    
     def __init__(self, size=9):
         """
         Initialize a Sudoku board.
         
         Args:
-            size (int): Board size (n). Must be a perfect square. Defaults to 9.
+            size (int): Board size (n). Must be a perfect square no larger
+                        than 225. Defaults to 9.
             
         Raises:
-            ValueError: If size is not a perfect square.
+            ValueError: If size is not a supported perfect square.
         """
-        # Validate that size is a perfect square
+        # Validate the size and look up its square root in one step
         self.size = size
-        self.subgrid_size = int(math.sqrt(size))
+        self.subgrid_size = _SUBGRID_SIZES.get(size)
+        if self.subgrid_size is None:
+            raise ValueError(f"Board size must be a perfect square no larger than 225. Got {size}.")
+        
+        # Precompute the lookup tables so the hot paths index a table instead
+        # of doing integer divisions or building tuples per access
+        self._box_of, self._box_origin, self._positions, self._peers = (
+            _get_tables(size, self.subgrid_size))
+        
+        # Bitmasks of the digits used in each row, column and subgrid.
+        # Bit (value - 1) is set when value is present in that unit.
+        self._row_used = [0] * size
+        self._col_used = [0] * size
+        self._box_used = [0] * size
+        
+        # Number of filled cells in each row, column and subgrid. A unit holds
+        # a duplicate exactly when its mask has fewer bits set than this count.
+        self._row_count = [0] * size
+        self._col_count = [0] * size
+        self._box_count = [0] * size
         
-        # Check if size is a perfect square
-        if self.subgrid_size * self.subgrid_size != size:
-            raise ValueError(f"Board size must be a perfect square. Got {size}.")
+        # Total duplicates over all units, i.e. the sum over every row, column
+        # and subgrid of its fill count minus its distinct digits. The board
+        # is valid exactly when this is zero.
+        self._conflicts = 0
+        
+        # Flat positions of the empty cells, kept up to date on every write.
+        # _empty_slot maps a flat position to its index in _empty (or -1 when
+        # the cell is filled) so either update is O(1).
+        self._empty = list(range(size * size))
+        self._empty_slot = list(range(size * size))
+        
+        # Cell values as one unsigned byte per cell in row-major order, with 0
+        # for an empty cell. This is the authoritative value store: cells are
+        # views over it, and a copy is a single memcpy.
+        self._values = bytearray(size * size)
+        
+        # Candidate bitmask per cell in row-major order, with bit (value - 1)
+        # set when value is possible. Cells expose it as a set-like view.
+        self._full_mask = (1 << size) - 1
+        self._candidates = [self._full_mask] * (size * size)
             
-        # Initialize the grid with empty cells
-        self.grid = []
-        for row in range(size):
-            row_cells = []
-            for col in range(size):
-                row_cells.append(Cell(row, col, board_size=size))
-            self.grid.append(row_cells)
+        # Rendered __str__ output, cleared whenever a value changes
+        self._str_cache = None
+    
+    @classmethod
+    def from_grid(cls, grid):
+        """
+        Create a board from a square grid of values.
+        
+        Args:
+            grid (list): List of rows, each a list of int values or None for
+                         empty cells. The number of rows sets the board size.
+            
+        Returns:
+            Board: A new board holding the grid's values, with possible
+                   values already updated
+            
+        Raises:
+            ValueError: If the grid is not square, its size is not a valid
+                        board size, or a value is out of range
+        """
+        size = len(grid)
+        if any(len(row) != size for row in grid):
+            raise ValueError(f"Grid must be square: expected {size} values in every row.")
+        
+        board = cls(size)
+        for row, values in enumerate(grid):
+            for col, value in enumerate(values):
+                if value is not None:
+                    board.set_value(row, col, value)
+        
+        # One pass over the flat buffers brings every candidate mask in line
+        board.update_possible_values()
+        return board
     
     def get_cell(self, row, col):
         """
         Get the cell at the specified position.
         
+        The cell is a view over the board's buffers: it reflects later board
+        changes, and writes through it update the board.
+        
         Args:
             row (int): Row index (0-based)
             col (int): Column index (0-based)
@@ -49,9 +269,12 @@ class Board:
         Raises:
             IndexError: If row or col is out of bounds
         """
-        if not (0 <= row < self.size and 0 <= col < self.size):
-            raise IndexError(f"Position ({row}, {col}) is out of bounds for board of size {self.size}")
-        return self.grid[row][col]
+        # One chained comparison checks both coordinates:
+        # 0 <= row, row < size, size > col and col >= 0
+        size = self.size
+        if not 0 <= row < size > col >= 0:
+            raise IndexError(f"Position ({row}, {col}) is out of bounds for board of size {size}")
+        return _BoardCell(self, row, col)
     
     def set_value(self, row, col, value):
         """
@@ -66,13 +289,223 @@ class Board:
             IndexError: If row or col is out of bounds
             ValueError: If value is invalid for the board size
         """
-        if not (0 <= row < self.size and 0 <= col < self.size):
-            raise IndexError(f"Position ({row}, {col}) is out of bounds for board of size {self.size}")
+        size = self.size
+        if not 0 <= row < size > col >= 0:
+            raise IndexError(f"Position ({row}, {col}) is out of bounds for board of size {size}")
             
-        if value is not None and not (1 <= value <= self.size):
-            raise ValueError(f"Value must be between 1 and {self.size} or None. Got {value}")
+        if value is not None and not (1 <= value <= size):
+            raise ValueError(f"Value must be between 1 and {size} or None. Got {value}")
+        
+        index = row * size + col
+        old_value = self._values[index] or None
+        self._values[index] = value or 0
+        self._str_cache = None
+        # A filled cell's only candidate is its value; clearing it reopens all
+        self._candidates[index] = _BIT[value] if value is not None else self._full_mask
+        box = self._box_of[index]
+        
+        if old_value is None and value is not None:
+            self._remove_empty(index)
+        elif old_value is not None and value is None:
+            self._add_empty(index)
+        
+        if old_value is not None:
+            # Only look for duplicates in these units when the board has any
+            conflicts = self._unit_conflicts(row, col, box) if self._conflicts else 0
+            if conflicts:
+                # One of the units holds a duplicate, so the old digit may
+                # still be present elsewhere: rebuild the masks from the grid
+                self._rebuild_masks(row, col)
+            else:
+                bit = _BIT[old_value]
+                self._row_used[row] ^= bit
+                self._col_used[col] ^= bit
+                self._box_used[box] ^= bit
+            self._row_count[row] -= 1
+            self._col_count[col] -= 1
+            self._box_count[box] -= 1
+            if conflicts:
+                self._conflicts += self._unit_conflicts(row, col, box) - conflicts
+        if value is not None:
+            bit = _BIT[value]
+            # Each unit that already holds the digit gains one duplicate
+            self._conflicts += (bool(self._row_used[row] & bit) + bool(self._col_used[col] & bit)
+                                + bool(self._box_used[box] & bit))
+            self._row_used[row] |= bit
+            self._col_used[col] |= bit
+            self._box_used[box] |= bit
+            self._row_count[row] += 1
+            self._col_count[col] += 1
+            self._box_count[box] += 1
+    
+    def _unit_conflicts(self, row, col, box):
+        """
+        Count the duplicates in one row, column and subgrid.
+        
+        A unit's duplicates are its filled cells minus its distinct digits.
+        
+        Args:
+            row (int): Row index
+            col (int): Column index
+            box (int): Subgrid index
             
-        self.grid[row][col].set_value(value)
+        Returns:
+            int: Total duplicates across the three units
+        """
+        return (self._row_count[row] - self._row_used[row].bit_count()
+                + self._col_count[col] - self._col_used[col].bit_count()
+                + self._box_count[box] - self._box_used[box].bit_count())
+    
+    def try_place(self, row, col, value):
+        """
+        Place a value if it is safe, in a single call.
+        
+        This fuses is_safe() and set_value() so the bounds and value checks
+        run once and the constraint check is a single bitmask test.
+        
+        Args:
+            row (int): Row index (0-based)
+            col (int): Column index (0-based)
+            value (int): The value to place
+            
+        Returns:
+            bool: True if the value was placed, False if the cell is already
+                  filled or the value conflicts with a value in the same row,
+                  column, or subgrid
+            
+        Raises:
+            IndexError: If row or col is out of bounds
+            ValueError: If value is invalid for the board size
+        """
+        size = self.size
+        if not 0 <= row < size > col >= 0:
+            raise IndexError(f"Position ({row}, {col}) is out of bounds for board of size {size}")
+            
+        if not (1 <= value <= size):
+            raise ValueError(f"Value must be between 1 and {size}. Got {value}")
+        
+        index = row * size + col
+        if self._values[index]:
+            return False
+        
+        box = self._box_of[index]
+        bit = _BIT[value]
+        if (self._row_used[row] | self._col_used[col] | self._box_used[box]) & bit:
+            return False
+        
+        self._row_used[row] |= bit
+        self._col_used[col] |= bit
+        self._box_used[box] |= bit
+        self._row_count[row] += 1
+        self._col_count[col] += 1
+        self._box_count[box] += 1
+        self._values[index] = value
+        self._candidates[index] = bit
+        self._str_cache = None
+        self._remove_empty(index)
+        return True
+    
+    def undo(self, row, col, value):
+        """
+        Remove a value previously placed with try_place().
+        
+        Because try_place() never creates a duplicate, the value's bit can be
+        cleared from the row, column and subgrid masks directly. If the board
+        holds duplicates from set_value(), the cell is cleared through
+        set_value() instead, which rebuilds the masks it needs.
+        
+        Args:
+            row (int): Row index (0-based)
+            col (int): Column index (0-based)
+            value (int): The value that was placed at (row, col)
+            
+        Raises:
+            IndexError: If row or col is out of bounds
+            ValueError: If the cell does not hold value
+        """
+        size = self.size
+        if not 0 <= row < size > col >= 0:
+            raise IndexError(f"Position ({row}, {col}) is out of bounds for board of size {size}")
+        
+        index = row * size + col
+        if self._values[index] != value:
+            raise ValueError(f"Cell ({row}, {col}) does not hold {value}")
+        
+        if self._conflicts:
+            self.set_value(row, col, None)
+            return
+        
+        box = self._box_of[index]
+        bit = _BIT[value]
+        self._row_used[row] ^= bit
+        self._col_used[col] ^= bit
+        self._box_used[box] ^= bit
+        self._row_count[row] -= 1
+        self._col_count[col] -= 1
+        self._box_count[box] -= 1
+        self._values[index] = 0
+        self._candidates[index] = self._full_mask
+        self._str_cache = None
+        self._add_empty(index)
+    
+    def _remove_empty(self, index):
+        """
+        Drop a flat position from the empty-cell list in O(1).
+        
+        The last entry is swapped into the removed entry's slot.
+        
+        Args:
+            index (int): Flat position (row * size + col) that was filled
+        """
+        empty = self._empty
+        empty_slot = self._empty_slot
+        slot = empty_slot[index]
+        last = empty.pop()
+        if last != index:
+            empty[slot] = last
+            empty_slot[last] = slot
+        empty_slot[index] = -1
+    
+    def _add_empty(self, index):
+        """
+        Append a flat position to the empty-cell list in O(1).
+        
+        Args:
+            index (int): Flat position (row * size + col) that was cleared
+        """
+        self._empty_slot[index] = len(self._empty)
+        self._empty.append(index)
+    
+    def _rebuild_masks(self, row, col):
+        """
+        Recompute the row, column and subgrid masks that contain (row, col).
+        
+        Args:
+            row (int): Row of the changed cell
+            col (int): Column of the changed cell
+        """
+        size = self.size
+        values = self._values
+        
+        # _BIT[0] is 0, so empty cells need no separate check
+        mask = 0
+        for value in values[row * size:(row + 1) * size]:
+            mask |= _BIT[value]
+        self._row_used[row] = mask
+        
+        mask = 0
+        for value in values[col::size]:
+            mask |= _BIT[value]
+        self._col_used[col] = mask
+        
+        box = self._box_of[row * size + col]
+        subgrid_row, subgrid_col = self._box_origin[box]
+        mask = 0
+        for r in range(subgrid_row, subgrid_row + self.subgrid_size):
+            start = r * size + subgrid_col
+            for value in values[start:start + self.subgrid_size]:
+                mask |= _BIT[value]
+        self._box_used[box] = mask
     
     def get_value(self, row, col):
         """
@@ -88,10 +521,31 @@ class Board:
         Raises:
             IndexError: If row or col is out of bounds
         """
-        if not (0 <= row < self.size and 0 <= col < self.size):
-            raise IndexError(f"Position ({row}, {col}) is out of bounds for board of size {self.size}")
+        size = self.size
+        if not 0 <= row < size > col >= 0:
+            raise IndexError(f"Position ({row}, {col}) is out of bounds for board of size {size}")
             
-        return self.grid[row][col].get_value()
+        return self._values[row * size + col] or None
+    
+    def reset(self):
+        """
+        Clear every cell and constraint so the board can be reused.
+        
+        Equivalent to constructing a fresh Board of the same size, but keeps
+        the existing buffers and lookup tables instead of reallocating them.
+        """
+        size = self.size
+        self._candidates[:] = [self._full_mask] * (size * size)
+        
+        for masks in (self._row_used, self._col_used, self._box_used,
+                      self._row_count, self._col_count, self._box_count):
+            masks[:] = [0] * size
+        
+        self._empty[:] = range(size * size)
+        self._empty_slot[:] = range(size * size)
+        self._values[:] = bytes(size * size)
+        self._str_cache = None
+        self._conflicts = 0
     
     def get_size(self):
         """
@@ -110,6 +564,27 @@ class Board:
             int: The size of the subgrids
         """
         return self.subgrid_size
+    
+    def get_subgrid_origin(self, row, col):
+        """
+        Get the top-left position of the subgrid containing a cell.
+        
+        Read from the precomputed subgrid tables, so no division is needed.
+        
+        Args:
+            row (int): Row index (0-based)
+            col (int): Column index (0-based)
+            
+        Returns:
+            tuple: (row, col) of the subgrid's top-left cell
+            
+        Raises:
+            IndexError: If row or col is out of bounds
+        """
+        size = self.size
+        if not 0 <= row < size > col >= 0:
+            raise IndexError(f"Position ({row}, {col}) is out of bounds for board of size {size}")
+        return self._box_origin[self._box_of[row * size + col]]
 
     def is_empty(self, row, col):
         """
@@ -125,27 +600,38 @@ class Board:
         Raises:
             IndexError: If row or col is out of bounds
         """
-        return self.get_value(row, col) is None
+        size = self.size
+        if not 0 <= row < size > col >= 0:
+            raise IndexError(f"Position ({row}, {col}) is out of bounds for board of size {size}")
+        
+        # 0 marks an empty cell in the value buffer
+        return not self._values[row * size + col]
     
     def get_empty_positions(self):
         """
         Get all empty positions on the board.
         
         Returns:
-            list: List of (row, col) tuples representing empty cell positions
+            list: Row-major list of (row, col) tuples representing empty cell positions
         """
-        empty_positions = []
-        for row in range(self.size):
-            for col in range(self.size):
-                if self.is_empty(row, col):
-                    empty_positions.append((row, col))
-        return empty_positions
+        # Read the maintained empty-cell list instead of scanning the grid
+        positions = self._positions
+        return [positions[index] for index in sorted(self._empty)]
+    
+    def get_empty_count(self):
+        """
+        Get the number of empty cells on the board.
+        
+        Returns:
+            int: Number of empty cells, read from the maintained empty-cell list
+        """
+        return len(self._empty)
     
     def print_grid(self):
         """
         Print the board grid to the console.
         """
-        print(str(self))
+        sys.stdout.write(str(self) + "\n")
     
     def __str__(self):
         """
@@ -154,36 +640,44 @@ class Board:
         Returns:
             str: Formatted string representation of the board
         """
-        # Calculate the width needed for each cell based on board size
-        # For example, a 16x16 board needs 2 characters per cell (for numbers 10-16)
-        cell_width = len(str(self.size))
+        # Reuse the last rendering until a value changes
+        if self._str_cache is not None:
+            return self._str_cache
         
-        # Create the horizontal separator line
-        separator = self._create_horizontal_separator(cell_width)
+        size = self.size
+        subgrid_size = self.subgrid_size
+        tokens, band_separator = self._get_render_parts()
         
-        result = []
-        for row in range(self.size):
-            # Add separators between subgrids
-            if row > 0 and row % self.subgrid_size == 0:
-                result.append(separator)
-            
-            row_str = []
-            for col in range(self.size):
-                # Add separators between subgrids
-                if col > 0 and col % self.subgrid_size == 0:
-                    row_str.append("|")
-                
-                value = self.get_value(row, col)
-                if value is None:
-                    # Empty cell
-                    row_str.append(" " * cell_width)
-                else:
-                    # Format the value with proper width
-                    row_str.append(str(value).rjust(cell_width))
-            
-            result.append(" ".join(row_str))
+        # Map the value buffer through the digit table, build each row by
+        # joining its subgrids' cells with "|" between them, then join the
+        # rows band by band with the separator line between bands
+        cells = [tokens[value] for value in self._values]
+        rows = [" | ".join(" ".join(cells[offset:offset + subgrid_size])
+                           for offset in range(start, start + size, subgrid_size))
+                for start in range(0, size * size, size)]
+        self._str_cache = band_separator.join(
+            "\n".join(rows[band:band + subgrid_size]) for band in range(0, size, subgrid_size))
+        return self._str_cache
+    
+    def _get_render_parts(self):
+        """
+        Get the formatting pieces for __str__, building them once per size.
         
-        return "\n".join(result)
+        Returns:
+            tuple: (tokens, band_separator) where tokens maps a cell value to
+                   its padded text (0 to blanks) and band_separator is the
+                   horizontal separator line with its surrounding newlines
+        """
+        parts = _RENDER_PARTS.get(self.size)
+        if parts is None:
+            # Calculate the width needed for each cell based on board size
+            # For example, a 16x16 board needs 2 characters per cell (for numbers 10-16)
+            cell_width = len(str(self.size))
+            tokens = (" " * cell_width,) + tuple(str(value).rjust(cell_width)
+                                                 for value in range(1, self.size + 1))
+            separator = self._create_horizontal_separator(cell_width)
+            parts = _RENDER_PARTS[self.size] = (tokens, "\n" + separator + "\n")
+        return parts
     
     def _create_horizontal_separator(self, cell_width):
         """
@@ -220,33 +714,18 @@ class Board:
             ValueError: If num is invalid for the board size
         """
         # Validate inputs
-        if not (0 <= row < self.size and 0 <= col < self.size):
-            raise IndexError(f"Position ({row}, {col}) is out of bounds for board of size {self.size}")
+        size = self.size
+        if not 0 <= row < size > col >= 0:
+            raise IndexError(f"Position ({row}, {col}) is out of bounds for board of size {size}")
             
-        if not (1 <= num <= self.size):
-            raise ValueError(f"Number must be between 1 and {self.size}. Got {num}")
-        
-        # Check row constraint
-        for c in range(self.size):
-            if self.get_value(row, c) == num:
-                return False
-        
-        # Check column constraint
-        for r in range(self.size):
-            if self.get_value(r, col) == num:
-                return False
-        
-        # Check subgrid constraint
-        subgrid_row = (row // self.subgrid_size) * self.subgrid_size
-        subgrid_col = (col // self.subgrid_size) * self.subgrid_size
-        
-        for r in range(subgrid_row, subgrid_row + self.subgrid_size):
-            for c in range(subgrid_col, subgrid_col + self.subgrid_size):
-                if self.get_value(r, c) == num:
-                    return False
+        if not (1 <= num <= size):
+            raise ValueError(f"Number must be between 1 and {size}. Got {num}")
         
-        # If we've passed all checks, the placement is valid
-        return True
+        # The row, column and subgrid masks already record every digit in
+        # those units, so the three constraint checks are one bit test
+        used = (self._row_used[row] | self._col_used[col]
+                | self._box_used[self._box_of[row * size + col]])
+        return not used & _BIT[num]
 
     def is_valid(self):
         """
@@ -255,40 +734,9 @@ class Board:
         Returns:
             bool: True if the board is valid, False otherwise
         """
-        # Check each row for duplicates
-        for row in range(self.size):
-            values = set()
-            for col in range(self.size):
-                val = self.get_value(row, col)
-                if val is not None:
-                    if val in values:
-                        return False  # Duplicate found in row
-                    values.add(val)
-        
-        # Check each column for duplicates
-        for col in range(self.size):
-            values = set()
-            for row in range(self.size):
-                val = self.get_value(row, col)
-                if val is not None:
-                    if val in values:
-                        return False  # Duplicate found in column
-                    values.add(val)
-        
-        # Check each subgrid for duplicates
-        for subgrid_row in range(0, self.size, self.subgrid_size):
-            for subgrid_col in range(0, self.size, self.subgrid_size):
-                values = set()
-                for row in range(subgrid_row, subgrid_row + self.subgrid_size):
-                    for col in range(subgrid_col, subgrid_col + self.subgrid_size):
-                        val = self.get_value(row, col)
-                        if val is not None:
-                            if val in values:
-                                return False  # Duplicate found in subgrid
-                            values.add(val)
-        
-        # If we've passed all checks, the board is valid
-        return True
+        # set_value() keeps a running count of duplicates across all rows,
+        # columns and subgrids, and try_place() never adds one
+        return not self._conflicts
 
     def update_possible_values(self, row=None, col=None, affected_only=False):
         """
@@ -314,39 +762,52 @@ class Board:
             
         # If specific cell is provided
         if row is not None and col is not None:
-            if not (0 <= row < self.size and 0 <= col < self.size):
+            if not 0 <= row < self.size > col >= 0:
                 raise IndexError(f"Position ({row}, {col}) is out of bounds for board of size {self.size}")
                 
-            # Reset possible values for the cell based on board size
-            cell = self.get_cell(row, col)
-            
             if affected_only:
                 # Update only cells affected by (row, col)
                 self._update_affected_cells(row, col)
             else:
-                # Update the specific cell
-                if cell.get_value() is not None:
-                    # If cell has a value, possible values is just that value
-                    cell.possible_values = {cell.get_value()}
-                else:
-                    # Otherwise, start with all values possible
-                    cell.possible_values = set(range(1, self.size + 1))
-                    
-                    # Use cached information about restricted values if possible
-                    restricted_values = self._get_restricted_values(row, col)
-                    
-                    # Remove all restricted values at once (set difference operation)
-                    cell.possible_values -= restricted_values
+                self._refresh_candidates(row * self.size + col)
         else:
             # Update all cells
             if affected_only:
                 # Not applicable when no specific cell is provided
                 affected_only = False
                 
-            for r in range(self.size):
-                for c in range(self.size):
-                    # Update each cell individually
-                    self.update_possible_values(r, c, affected_only=False)
+            # Rebuild every mask in one pass over the flat buffers: a filled
+            # cell's only candidate is its value, an empty cell's are the
+            # digits its row, column and subgrid do not use
+            row_used, col_used, box_used = self._row_used, self._col_used, self._box_used
+            full_mask = self._full_mask
+            self._candidates[:] = [
+                _BIT[value] if value
+                else full_mask & ~(row_used[r] | col_used[c] | box_used[box])
+                for value, (r, c), box in zip(self._values, self._positions, self._box_of)
+            ]
+    
+    def _refresh_candidates(self, index):
+        """
+        Recompute one cell's candidate mask from the constraint masks.
+        
+        Args:
+            index (int): Flat position (row * size + col) of the cell
+            
+        Returns:
+            int: The new candidate mask
+        """
+        value = self._values[index]
+        if value:
+            # If cell has a value, possible values is just that value
+            mask = _BIT[value]
+        else:
+            # Otherwise every digit not used in the row, column or subgrid
+            row, col = self._positions[index]
+            mask = self._full_mask & ~(self._row_used[row] | self._col_used[col]
+                                       | self._box_used[self._box_of[index]])
+        self._candidates[index] = mask
+        return mask
     
     def _update_affected_cells(self, row, col):
         """
@@ -364,97 +825,116 @@ class Board:
             self.update_possible_values(row, col, affected_only=False)
             return
             
-        # For filled cells, update all cells in same row, column, and subgrid
-        # Row cells
-        for c in range(self.size):
-            if c != col and self.is_empty(row, c):
-                cell = self.get_cell(row, c)
-                if value in cell.possible_values:
-                    cell.possible_values.remove(value)
-        
-        # Column cells
-        for r in range(self.size):
-            if r != row and self.is_empty(r, col):
-                cell = self.get_cell(r, col)
-                if value in cell.possible_values:
-                    cell.possible_values.remove(value)
-        
-        # Subgrid cells
-        subgrid_row = (row // self.subgrid_size) * self.subgrid_size
-        subgrid_col = (col // self.subgrid_size) * self.subgrid_size
+        # For filled cells, clear the value's bit from every empty cell in
+        # the same row, column, and subgrid, read from the peer table
+        values = self._values
+        candidates = self._candidates
+        keep = ~(_BIT[value])
         
-        for r in range(subgrid_row, subgrid_row + self.subgrid_size):
-            for c in range(subgrid_col, subgrid_col + self.subgrid_size):
-                if (r != row or c != col) and self.is_empty(r, c):
-                    cell = self.get_cell(r, c)
-                    if value in cell.possible_values:
-                        cell.possible_values.remove(value)
+        for index in self._peers[row * self.size + col]:
+            if not values[index]:
+                candidates[index] &= keep
     
-    def _get_restricted_values(self, row, col):
+    def copy(self):
         """
-        Get a set of values that are restricted for a cell based on row, column, and subgrid.
-        This is cached for performance.
+        Create a deep copy of the board.
         
-        Args:
-            row (int): Row of the cell
-            col (int): Column of the cell
-            
         Returns:
-            set: Set of values that cannot be placed in this cell
+            Board: A new Board instance with the same state
         """
-        # Create a set to hold restricted values
-        restricted_values = set()
+        # Allocate the instance without running __init__: every buffer it
+        # would build is replaced below, and the read-only lookup tables are
+        # shared by reference
+        new_board = object.__new__(type(self))
+        new_board.size = self.size
+        new_board.subgrid_size = self.subgrid_size
+        new_board._box_of = self._box_of
+        new_board._box_origin = self._box_origin
+        new_board._positions = self._positions
+        new_board._peers = self._peers
+        new_board._full_mask = self._full_mask
         
-        # Add values from the same row
-        for c in range(self.size):
-            val = self.get_value(row, c)
-            if val is not None:
-                restricted_values.add(val)
+        # All cell state lives in flat buffers, so slice-copying them copies
+        # every cell's value and possible values along with the constraint
+        # masks and fill counts
+        new_board._candidates = self._candidates[:]
+        new_board._row_used = self._row_used[:]
+        new_board._col_used = self._col_used[:]
+        new_board._box_used = self._box_used[:]
+        new_board._row_count = self._row_count[:]
+        new_board._col_count = self._col_count[:]
+        new_board._box_count = self._box_count[:]
+        new_board._empty = self._empty[:]
+        new_board._empty_slot = self._empty_slot[:]
+        new_board._values = self._values[:]
+        new_board._str_cache = self._str_cache
+        new_board._conflicts = self._conflicts
         
-        # Add values from the same column
-        for r in range(self.size):
-            val = self.get_value(r, col)
-            if val is not None:
-                restricted_values.add(val)
-        
-        # Add values from the same subgrid
-        subgrid_row = (row // self.subgrid_size) * self.subgrid_size
-        subgrid_col = (col // self.subgrid_size) * self.subgrid_size
+        return new_board
+    
+    def __deepcopy__(self, memo):
+        """Copy the board for copy.deepcopy() through copy()."""
+        return self.copy()
+    
+    def __reduce__(self):
+        """
+        Reduce the board to its mutable buffers for pickling.
         
-        for r in range(subgrid_row, subgrid_row + self.subgrid_size):
-            for c in range(subgrid_col, subgrid_col + self.subgrid_size):
-                val = self.get_value(r, c)
-                if val is not None:
-                    restricted_values.add(val)
+        Only per-board state is serialized. The per-size lookup tables are
+        rebuilt or fetched from the cache on load, so a pickled board costs
+        O(n^2) bytes instead of carrying its peer table along.
         
-        return restricted_values
-
-    def copy(self):
+        Returns:
+            tuple: (constructor, arguments) understood by pickle and copy
         """
-        Create a deep copy of the board.
+        return (type(self)._from_state,
+                (self.size, bytes(self._values), self._candidates,
+                 self._row_used, self._col_used, self._box_used,
+                 self._row_count, self._col_count, self._box_count,
+                 self._empty, self._conflicts))
+    
+    @classmethod
+    def _from_state(cls, size, values, candidates, row_used, col_used, box_used,
+                    row_count, col_count, box_count, empty, conflicts):
+        """
+        Rebuild a board from the state produced by __reduce__().
         
+        Args:
+            size (int): Board size (n)
+            values (bytes): Cell values in row-major order, 0 for empty
+            candidates (list): Candidate bitmask per cell
+            row_used, col_used, box_used (list): Digit bitmasks per unit
+            row_count, col_count, box_count (list): Filled cells per unit
+            empty (list): Flat positions of the empty cells
+            conflicts (int): Running duplicate count
+            
         Returns:
-            Board: A new Board instance with the same state
+            Board: A new board with fresh buffers and shared lookup tables
         """
-        # Create a new board with the same size
-        new_board = Board(self.size)
+        board = object.__new__(cls)
+        board.size = size
+        board.subgrid_size = _SUBGRID_SIZES[size]
+        board._box_of, board._box_origin, board._positions, board._peers = (
+            _get_tables(size, board.subgrid_size))
+        board._full_mask = (1 << size) - 1
         
-        # Copy each cell individually
-        for row in range(self.size):
-            for col in range(self.size):
-                # Get the original cell and its copy
-                original_cell = self.get_cell(row, col)
-                new_cell = new_board.get_cell(row, col)
-                
-                # Copy the value
-                value = original_cell.get_value()
-                if value is not None:
-                    new_cell.set_value(value)
-                
-                # Copy the possible values (directly access the attribute for efficiency)
-                new_cell.possible_values = set(original_cell.possible_values)
+        board._values = bytearray(values)
+        board._candidates = list(candidates)
+        board._row_used = list(row_used)
+        board._col_used = list(col_used)
+        board._box_used = list(box_used)
+        board._row_count = list(row_count)
+        board._col_count = list(col_count)
+        board._box_count = list(box_count)
+        board._empty = list(empty)
+        # The slot index is derived from the empty list rather than stored
+        board._empty_slot = [-1] * (size * size)
+        for slot, index in enumerate(board._empty):
+            board._empty_slot[index] = slot
+        board._conflicts = conflicts
+        board._str_cache = None
         
-        return new_board
+        return board
 
     def get_mrv_cell(self):
         """
@@ -463,31 +943,38 @@ class Board:
         Returns:
             tuple or None: (row, col) of the cell with fewest possible values, or None if no empty cells exist
         """
-        min_possibilities = float('inf')  # Start with infinity
+        values = self._values
+        candidates = self._candidates
+        positions = self._positions
+        row_used = self._row_used
+        col_used = self._col_used
+        box_used = self._box_used
+        box_of = self._box_of
+        full_mask = self._full_mask
+        
+        min_possibilities = self.size + 1  # More than any cell can have
         mrv_cell = None
         
-        # Search all cells on the board
-        for row in range(self.size):
-            for col in range(self.size):
-                # Skip cells that are already filled
-                if not self.is_empty(row, col):
-                    continue
-                
-                # Make sure possible values are up to date for this cell
-                self.update_possible_values(row, col)
-                
-                # Get the number of possible values for this cell
-                num_possibilities = len(self.get_cell(row, col).possible_values)
+        # Visit the empty cells in row-major order: bytearray.find() skips
+        # over runs of filled cells in C
+        index = values.find(0)
+        while index >= 0:
+            # Refresh the cell's candidates and count them
+            row, col = positions[index]
+            mask = full_mask & ~(row_used[row] | col_used[col] | box_used[box_of[index]])
+            candidates[index] = mask
+            num_possibilities = mask.bit_count()
+            
+            # If this cell has fewer possibilities, update our MRV cell
+            if num_possibilities < min_possibilities:
+                min_possibilities = num_possibilities
+                mrv_cell = positions[index]
                 
-                # If this cell has fewer possibilities, update our MRV cell
-                if num_possibilities < min_possibilities:
-                    min_possibilities = num_possibilities
-                    mrv_cell = (row, col)
-                    
-                    # If we found a cell with only one possibility, we can return immediately
-                    # as this is the minimum possible
-                    if num_possibilities == 1:
-                        return mrv_cell
+                # A cell with one possibility cannot be beaten, and a cell with
+                # none is a dead end the caller should see straight away
+                if num_possibilities <= 1:
+                    return mrv_cell
+            index = values.find(0, index + 1)
         
         # Return the cell with the fewest possibilities, or None if board is filled
         return mrv_cell
@@ -503,62 +990,110 @@ class Board:
         Returns:
             int: The number of solutions found (up to max_count).
         """
-        # Track solutions found
-        solutions = [0]
+        # A board that already breaks a rule has no solutions. Checking once
+        # here lets the search place digits straight from the candidate
+        # masks, which never adds a conflict
+        if not self.is_valid():
+            return 0
         
-        # Make a copy of the board to work with
-        board_copy = self.copy()
-        # Update all possible values before starting
-        board_copy.update_possible_values()
+        return self._solve_count(max_count)
+    
+    def _solve_count(self, max_count):
+        """
+        Count solutions with an iterative bitmask search.
         
-        def backtrack():
-            # If we've already found max_count solutions, stop
-            if solutions[0] >= max_count:
-                return
-                
-            # Find the most constrained empty cell using MRV
-            mrv_cell = board_copy.get_mrv_cell()
-            
-            # If no empty cells, we found a solution
-            if mrv_cell is None:
-                solutions[0] += 1
-                return
+        The search works on private copies of the row, column and subgrid
+        masks and never touches the board. Each level picks the empty cell
+        with the fewest candidates (MRV), takes candidates lowest bit first
+        with cands & -cands, and undoes a placement by clearing its bit, so
+        there are no board copies and no recursion.
+        
+        Args:
+            max_count (int): Stop once this many solutions are found
             
-            # Get the row and column of the MRV cell
-            row, col = mrv_cell
+        Returns:
+            int: The number of solutions found (up to max_count)
+        """
+        if max_count <= 0:
+            return 0
+        
+        full_mask = self._full_mask
+        positions = self._positions
+        box_of = self._box_of
+        row_used = self._row_used[:]
+        col_used = self._col_used[:]
+        box_used = self._box_used[:]
+        
+        # cells[depth:] are the cells still empty at that depth; the cell
+        # chosen at each depth is swapped into cells[depth]
+        cells = self._empty[:]
+        num_cells = len(cells)
+        if not num_cells:
+            return 1
+        
+        # remaining[depth] holds the untried candidates of cells[depth] and
+        # placed[depth] the bit currently placed there
+        remaining = [0] * num_cells
+        placed = [0] * num_cells
+        count = 0
+        depth = 0
+        
+        while depth >= 0:
+            if placed[depth] == 0 and remaining[depth] == 0:
+                # Entering this depth: choose the MRV cell among the empties
+                best_slot = depth
+                best_mask = 0
+                best_count = full_mask.bit_length() + 1
+                for slot in range(depth, num_cells):
+                    index = cells[slot]
+                    row, col = positions[index]
+                    mask = full_mask & ~(row_used[row] | col_used[col] | box_used[box_of[index]])
+                    mask_count = mask.bit_count()
+                    if mask_count < best_count:
+                        best_slot, best_mask, best_count = slot, mask, mask_count
+                        # Nothing beats a dead end or a forced cell
+                        if mask_count <= 1:
+                            break
+                cells[depth], cells[best_slot] = cells[best_slot], cells[depth]
+                remaining[depth] = best_mask
+            else:
+                # Returning to this depth: take back the digit placed here
+                bit = placed[depth]
+                index = cells[depth]
+                row, col = positions[index]
+                row_used[row] ^= bit
+                col_used[col] ^= bit
+                box_used[box_of[index]] ^= bit
+                placed[depth] = 0
             
-            # Save possible values before any modifications
-            possible_values = set(board_copy.get_cell(row, col).possible_values)
+            cands = remaining[depth]
+            if not cands:
+                # Every candidate here has been tried: backtrack
+                depth -= 1
+                continue
             
-            # Try each possible value for this cell
-            for num in possible_values:
-                # Place the value
-                board_copy.set_value(row, col, num)
-                
-                # Verify the move is valid (important for checking board consistency)
-                if board_copy.is_valid():
-                    # Update constraints
-                    board_copy.update_possible_values()
-                    
-                    # Recurse to next cell
-                    backtrack()
-                    
-                    # If we've reached max_count, stop processing further
-                    if solutions[0] >= max_count:
-                        board_copy.set_value(row, col, None)
-                        return
-                
-                # Backtrack - remove the value
-                board_copy.set_value(row, col, None)
+            if depth + 1 == num_cells:
+                # Last empty cell: each remaining candidate completes a
+                # solution
+                count += cands.bit_count()
+                if count >= max_count:
+                    return max_count
+                remaining[depth] = 0
+                depth -= 1
+                continue
             
-            # Reset constraints after trying all values
-            board_copy.update_possible_values(row, col)
+            # Place the lowest remaining candidate and go one level deeper
+            bit = cands & -cands
+            remaining[depth] = cands ^ bit
+            placed[depth] = bit
+            index = cells[depth]
+            row, col = positions[index]
+            row_used[row] |= bit
+            col_used[col] |= bit
+            box_used[box_of[index]] |= bit
+            depth += 1
         
-        # Start backtracking
-        backtrack()
-        
-        # Return the number of solutions found
-        return solutions[0]
+        return count
 
     def remove_clues(self, num_clues):
         """
@@ -604,6 +1139,21 @@ class Board:
         import random
         random.shuffle(filled_positions)
         
+        # Least-constraining first: try the clues that would leave the fewest
+        # candidates behind if removed, which are the most likely to keep the
+        # solution unique. The stable sort keeps the shuffled order on ties.
+        def removal_score(position):
+            row, col = position
+            index = row * self.size + col
+            used = (self._row_used[row] | self._col_used[col]
+                    | self._box_used[self._box_of[index]])
+            return (self._full_mask & ~used | _BIT[self._values[index]]).bit_count()
+        
+        filled_positions.sort(key=removal_score)
+        
+        # Whether board_copy is known to have exactly one solution
+        known_unique = board_copy.count_solutions() == 1
+        
         # Keep track of removals
         removed_positions = []
         
@@ -619,10 +1169,15 @@ class Board:
             
             # Try removing this clue
             board_copy.set_value(row, col, None)
-            board_copy.update_possible_values()  # Update constraints after removal
             
-            # Check if the board still has exactly one solution
-            if board_copy.count_solutions() == 1:
+            # A removed clue that its row, column and subgrid still force
+            # cannot add a solution, so a unique board stays unique without
+            # a search. Otherwise check that exactly one solution remains,
+            # stopping at the second one.
+            mask = board_copy._refresh_candidates(row * self.size + col)
+            if (known_unique and not mask & (mask - 1)) or board_copy.count_solutions(max_count=2) == 1:
+                known_unique = True
+                
                 # Removal was successful, update the original board
                 self.set_value(row, col, None)
                 self.update_possible_values(row, col)  # Update constraints for the original board too
@@ -630,7 +1185,6 @@ class Board:
             else:
                 # Removal resulted in 0 or multiple solutions, put it back
                 board_copy.set_value(row, col, value)
-                board_copy.update_possible_values(row, col)  # Restore constraints
         
         # Check if we successfully removed enough clues
-        return len(removed_positions) == clues_to_remove
\ No newline at end of file
+        return len(removed_positions) == clues_to_remove
@@ -1,13 +1,141 @@
 """
 Cell module for Sudoku generator.
 
-This module contains the Cell class which represents a single cell in a Sudoku grid.
+This module contains the Cell class which represents a single cell in a Sudoku grid,
+and the DigitSet view used for its possible values.
 """
+from collections.abc import MutableSet
 
 
-class Cell:
+def _mask_of(values):
+    """
+    Build a digit bitmask from an iterable of values.
+    
+    Args:
+        values (iterable): Digits to include
+        
+    Returns:
+        int: Bitmask with bit (value - 1) set for every value
+    """
+    mask = 0
+    for value in values:
+        mask |= 1 << (value - 1)
+    return mask
+
+
+class DigitSet(MutableSet):
+    """
+    Mutable set of digits stored as a bitmask.
+    
+    The mask lives at masks[index] in a list shared with the owner, so the
+    view is live: edits through it update the owner, and the owner's updates
+    show through it. Behaves like a set of ints (membership, length, ascending
+    iteration, add/discard/remove/clear, comparison with plain sets) while
+    the owner stores one int instead of a set object.
+    """
+    
+    __slots__ = ('_masks', '_index')
+    
+    def __init__(self, masks, index):
+        """
+        Initialize the view.
+        
+        Args:
+            masks (list): List holding the mask
+            index (int): Position of the mask in the list
+        """
+        self._masks = masks
+        self._index = index
+    
+    @classmethod
+    def _from_iterable(cls, iterable):
+        # Results of set operators (view - other, view & other, ...) are
+        # detached plain sets, not views
+        return set(iterable)
+    
+    def __contains__(self, value):
+        return (isinstance(value, int) and value >= 1
+                and (self._masks[self._index] >> (value - 1)) & 1 == 1)
+    
+    def __iter__(self):
+        mask = self._masks[self._index]
+        value = 1
+        while mask:
+            if mask & 1:
+                yield value
+            mask >>= 1
+            value += 1
+    
+    def __len__(self):
+        return self._masks[self._index].bit_count()
+    
+    def __eq__(self, other):
+        if isinstance(other, DigitSet):
+            return self._masks[self._index] == other._masks[other._index]
+        return super().__eq__(other)
+    
+    __hash__ = None
+    
+    def add(self, value):
+        self._masks[self._index] |= 1 << (value - 1)
+    
+    def discard(self, value):
+        if isinstance(value, int) and value >= 1:
+            self._masks[self._index] &= ~(1 << (value - 1))
+    
+    def clear(self):
+        self._masks[self._index] = 0
+    
+    def __repr__(self):
+        return repr(set(self))
+
+
+class _CellBase:
+    """
+    Behavior shared by stored cells and board-bound cell views.
+    
+    Holds only the position; subclasses provide value, possible_values,
+    num_possible() and set_value() from wherever they keep the cell's state.
+    """
+    
+    __slots__ = ('row', 'col')
+    
+    def get_value(self):
+        """Get the current value of the cell."""
+        return self.value
+    
+    def get_position(self):
+        """
+        Get the position of the cell as (row, col).
+        
+        Returns:
+            tuple: (row, column) position
+        """
+        return (self.row, self.col)
+    
+    def __str__(self):
+        """String representation of the cell."""
+        if self.value is None:
+            return "."
+        return str(self.value)
+    
+    def __repr__(self):
+        """
+        Detailed representation of the cell.
+        
+        Returns:
+            str: Detailed string showing position and value
+        """
+        return f"Cell({self.row}, {self.col}, {self.value})"
+
+
+class Cell(_CellBase):
     """Represents a single cell in a Sudoku puzzle."""
     
+    # Fixed attribute layout: no per-instance __dict__. The possible values
+    # are one bitmask held in a single-element list so a DigitSet can view it.
+    __slots__ = ('value', '_board_size', '_masks')
+    
     def __init__(self, row, col, value=None, possible_values=None, board_size=9):
         """
         Initialize a Sudoku cell.
@@ -23,21 +151,36 @@ class Cell:
         self.row = row
         self.col = col
         self.value = value
+        self._board_size = board_size
         
         # Initialize possible values if not provided
         if possible_values is not None:
-            self.possible_values = set(possible_values)
+            self._masks = [_mask_of(possible_values)]
         else:
             # If cell has a value, possible values is just that value
             if value is not None:
-                self.possible_values = {value}
+                self._masks = [1 << (value - 1)]
             else:
                 # Otherwise, all values from 1 to board_size are possible
-                self.possible_values = set(range(1, board_size + 1))
+                self._masks = [(1 << board_size) - 1]
     
-    def get_value(self):
-        """Get the current value of the cell."""
-        return self.value
+    @property
+    def possible_values(self):
+        """DigitSet: Live set view of the cell's possible values."""
+        return DigitSet(self._masks, 0)
+    
+    @possible_values.setter
+    def possible_values(self, values):
+        self._masks[0] = _mask_of(values)
+    
+    def num_possible(self):
+        """
+        Get the number of possible values for the cell.
+        
+        Returns:
+            int: Count of possible values, read as the popcount of the mask
+        """
+        return self._masks[0].bit_count()
     
     def set_value(self, value):
         """
@@ -49,19 +192,10 @@ class Cell:
         self.value = value
         if value is not None:
             # When setting a value, update possible values to only that value
-            self.possible_values = {value}
+            self._masks[0] = 1 << (value - 1)
         else:
             # If value is None, reset possible values to all valid numbers
-            self.possible_values = set(range(1, 10))
-    
-    def get_position(self):
-        """
-        Get the position of the cell as (row, col).
-        
-        Returns:
-            tuple: (row, column) position
-        """
-        return (self.row, self.col)
+            self._masks[0] = (1 << self._board_size) - 1
     
     def copy(self):
         """
@@ -71,22 +205,7 @@ class Cell:
             Cell: A new Cell instance with the same attributes
         """
         # Create a new cell with the same row, col and value
-        new_cell = Cell(self.row, self.col, self.value)
-        # Explicitly copy the possible values to ensure deep copy
-        new_cell.possible_values = set(self.possible_values)
+        new_cell = Cell(self.row, self.col, self.value, board_size=self._board_size)
+        # Copy the possible values into the new cell's own mask
+        new_cell.possible_values = self.possible_values
         return new_cell
-    
-    def __str__(self):
-        """String representation of the cell."""
-        if self.value is None:
-            return "."
-        return str(self.value)
-    
-    def __repr__(self):
-        """
-        Detailed representation of the cell.
-        
-        Returns:
-            str: Detailed string showing position and value
-        """
-        return f"Cell({self.row}, {self.col}, {self.value})"
\ No newline at end of file
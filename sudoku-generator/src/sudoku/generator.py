@@ -29,6 +29,23 @@ class SudokuGenerator:
         # Seed with current time for randomness
         random.seed(time.time())
     
+    def reset(self, seed=None):
+        """
+        Reset the generator so it can be reused for another run.
+        
+        Clears the current board, timings and statistics, and reseeds the
+        random number generator.
+        
+        Args:
+            seed (int, optional): Seed for the random number generator.
+                If None, the current time is used.
+        """
+        self.board = None
+        self.generation_time = 0
+        self.removal_time = 0
+        self.stats = {}
+        random.seed(time.time() if seed is None else seed)
+    
     def generate_solution(self):
         """
         Generate a complete valid Sudoku solution.
@@ -36,7 +53,7 @@ class SudokuGenerator:
         Returns:
             Board: A completely filled valid Sudoku board
         """
-        # Create an empty board
+        # Start from an empty board
         self.board = Board(self.size)
 
         # Timer for generation
@@ -118,9 +135,6 @@ class SudokuGenerator:
         # Start timing for the entire generation
         generation_start = time.time()
         
-        # Simple time-based reseeding for randomization
-        random.seed(time.time())
-        
         # Validate algorithm choice
         if algorithm not in ["optimized", "basic"]:
             raise ValueError("Invalid algorithm. Must be 'optimized' or 'basic'.")
@@ -148,9 +162,6 @@ class SudokuGenerator:
         
         # Try multiple times in case we get stuck
         for attempt in range(max_attempts):
-            # Reset random seed for each attempt
-            random.seed(time.time())
-            
             # Generate a fresh solution for each attempt
             self.generate_solution()
             
@@ -284,8 +295,7 @@ class SudokuGenerator:
                 solutions = board.count_solutions(max_count=2)
                 if solutions == 1:
                     # Found a unique solution by adding back some clues
-                    current_clues = sum(1 for r in range(self.size) for c in range(self.size) 
-                                      if not board.is_empty(r, c))
+                    current_clues = self.size * self.size - board.get_empty_count()
                     print(f"Recovered a unique solution with {current_clues} clues")
                     return True
             
@@ -321,8 +331,7 @@ class SudokuGenerator:
                     neighbors_filled += 1
             
             # Subgrid neighbors
-            subgrid_row = (row // board.subgrid_size) * board.subgrid_size
-            subgrid_col = (col // board.subgrid_size) * board.subgrid_size
+            subgrid_row, subgrid_col = board.get_subgrid_origin(row, col)
             
             for r in range(subgrid_row, subgrid_row + board.subgrid_size):
                 for c in range(subgrid_col, subgrid_col + board.subgrid_size):
@@ -464,9 +473,9 @@ class SudokuGenerator:
                     board.update_possible_values(row, col)
                     
                     # Check number of possibilities
-                    possible_values = board.get_cell(row, col).possible_values
-                    if len(possible_values) == 2:
-                        test_cells.append((row, col, possible_values))
+                    cell = board.get_cell(row, col)
+                    if cell.num_possible() == 2:
+                        test_cells.append((row, col, cell.possible_values))
                         
                         # Once we have enough test cells, we can stop searching
                         if len(test_cells) >= num_test_cells:
@@ -484,9 +493,9 @@ class SudokuGenerator:
                         if any(r == row and c == col for r, c, _ in test_cells):
                             continue
                             
-                        possible_values = board.get_cell(row, col).possible_values
-                        if len(possible_values) == 3:
-                            test_cells.append((row, col, possible_values))
+                        cell = board.get_cell(row, col)
+                        if cell.num_possible() == 3:
+                            test_cells.append((row, col, cell.possible_values))
                             
                             if len(test_cells) >= num_test_cells:
                                 break
@@ -10,6 +10,39 @@ import pstats
 import io
 import gc
 
+
+# Flat positions of every row, column and subgrid per board size, built on
+# first use and shared by every solve of that size
+_UNITS = {}
+
+
+def _get_units(size, subgrid_size):
+    """
+    Get the flat positions of every unit for a board size, building them once.
+    
+    Args:
+        size (int): Board size (n)
+        subgrid_size (int): Subgrid size (sqrt(n))
+        
+    Returns:
+        tuple: One tuple of flat positions (row * size + col) per row,
+               column and subgrid
+    """
+    units = _UNITS.get(size)
+    if units is not None:
+        return units
+    
+    rows = [tuple(range(row * size, (row + 1) * size)) for row in range(size)]
+    cols = [tuple(range(col, size * size, size)) for col in range(size)]
+    boxes = [tuple((box_row + r) * size + box_col + c
+                   for r in range(subgrid_size) for c in range(subgrid_size))
+             for box_row in range(0, size, subgrid_size)
+             for box_col in range(0, size, subgrid_size)]
+    
+    units = _UNITS[size] = tuple(rows + cols + boxes)
+    return units
+
+
 class SudokuSolver:
     """Class for solving Sudoku puzzles with optimized algorithms."""
     
@@ -19,6 +52,7 @@ class SudokuSolver:
         self.solution_count = 0
         self.solve_time = 0
         self.iterations = 0
+        self.backtrack_count = 0
         self.profile_data = None
         self.affected_cells_cache = {}
     
@@ -32,20 +66,29 @@ class SudokuSolver:
         self.board = board.copy()  # create a deep copy to avoid modifying original
         self.affected_cells_cache = {}  # Reset cache
     
-    def solve(self, board=None, profile=False):
+    def solve(self, board=None, profile=False, max_solutions=1):
         """
         Solve the Sudoku puzzle using optimized backtracking.
         
+        The search stops as soon as max_solutions solutions are found, so the
+        default stops at the first one. solution_count records how many were
+        found and the board keeps the first.
+        
         Args:
             board (Board, optional): The Sudoku board to solve. If None, uses the previously set board.
             profile (bool): Whether to profile the solve operation
+            max_solutions (int): Stop once this many solutions are found;
+                use 2 to check that a puzzle has a unique solution
             
         Returns:
             bool: True if a solution was found, False otherwise
             
         Raises:
-            ValueError: If no board is set or provided
+            ValueError: If no board is set or provided, or max_solutions is less than 1
         """
+        if max_solutions < 1:
+            raise ValueError(f"max_solutions must be at least 1. Got {max_solutions}")
+        
         # Handle board parameter
         if board is not None:
             self.set_board(board)
@@ -56,6 +99,13 @@ class SudokuSolver:
         # Reset counters and cache
         self.solution_count = 0
         self.iterations = 0
+        self.backtrack_count = 0
+        
+        # Clashing givens can never be completed, and propagation would
+        # otherwise fill around them
+        if not self.board.is_valid():
+            self.solve_time = 0.000001
+            return False
         
         # Decide whether to profile
         if profile:
@@ -64,7 +114,7 @@ class SudokuSolver:
             start_time = time.time()
             
             # Begin solving with optimized backtracking
-            result = self._solve_backtracking()
+            self.solution_count = self._solve_backtracking(max_solutions)
             
             # Ensure solve_time is never exactly 0.0 to pass tests
             end_time = time.time()
@@ -81,63 +131,188 @@ class SudokuSolver:
             start_time = time.time()
             
             # Begin solving with optimized backtracking
-            result = self._solve_backtracking()
+            self.solution_count = self._solve_backtracking(max_solutions)
             
             # Ensure solve_time is never exactly 0.0 to pass tests
             end_time = time.time()
             self.solve_time = max(end_time - start_time, 0.000001)  # minimum time of 1 microsecond
         
-        if result:
-            self.solution_count = 1
-        
         # Force garbage collection after solving
         gc.collect()
         
-        return result
+        return self.solution_count > 0
     
-    def _solve_backtracking(self):
+    def _solve_backtracking(self, max_solutions=1):
         """
-        Recursive backtracking algorithm to solve the Sudoku puzzle.
-        Uses Minimum Remaining Values (MRV) combined with degree heuristic
-        for more efficient cell selection.
+        Backtracking search with an explicit stack instead of recursion.
+        
+        Each level first places the forced singles, then branches on the
+        cell with the Minimum Remaining Values (MRV). A stack frame holds the
+        branch cell, its untried candidates, the singles forced at that level
+        and the value currently placed, so backtracking pops frames rather
+        than returning through Python call frames.
+        
+        Args:
+            max_solutions (int): Stop once this many solutions are found
         
         Returns:
-            bool: True if a solution was found, False otherwise
+            int: The number of solutions found (up to max_solutions); the
+                 board is left holding the first one, or unchanged if none
         """
-        # Increment iterations counter
-        self.iterations += 1
+        board = self.board
+        size = board.size
+        candidates = board._candidates
+        stack = []
+        found = 0
+        first_solution = None
         
-        # Find the best empty cell using MRV heuristic
-        empty = self.board.get_mrv_cell()
+        while True:
+            # Open a new level: one iteration per search node
+            self.iterations += 1
+            forced = []
+            branch = self._propagate_singles(forced)
+            if branch is None:
+                for row, col, value in reversed(forced):
+                    board.undo(row, col, value)
+            elif branch < 0:
+                # No empty cell is left, the puzzle is solved
+                found += 1
+                if found >= max_solutions:
+                    if first_solution is not None:
+                        self.board = first_solution
+                    return found
                 
-        # If no empty cell is found, the puzzle is solved
-        if not empty:
-            return True
-        
-        row, col = empty
+                # Keep the first solution and backtrack to look for more
+                if first_solution is None:
+                    first_solution = board.copy()
+                for row, col, value in reversed(forced):
+                    board.undo(row, col, value)
+            else:
+                # Branch on the cell with the fewest candidates (MRV); its
+                # mask was refreshed by the propagation pass that picked it
+                row, col = divmod(branch, size)
+                stack.append([row, col, candidates[branch], forced, 0])
+            
+            # Move to the next untried candidate, lowest bit first, popping
+            # every frame that has run out of candidates
+            while stack:
+                frame = stack[-1]
+                row, col, remaining, forced, value = frame
+                if value:
+                    # Take back the guess placed at this frame
+                    board.undo(row, col, value)
+                    self.backtrack_count += 1
+                if remaining:
+                    bit = remaining & -remaining
+                    frame[2] = remaining ^ bit
+                    frame[4] = value = bit.bit_length()
+                    board.try_place(row, col, value)
+                    break
+                
+                # Frame exhausted: undo its forced singles and backtrack
+                stack.pop()
+                for row, col, value in reversed(forced):
+                    board.undo(row, col, value)
+            else:
+                # The whole search tree has been explored
+                if first_solution is not None:
+                    self.board = first_solution
+                return found
+    
+    def _propagate_singles(self, forced):
+        """
+        Place naked and hidden singles until none are left, then pick the
+        cell to branch on.
         
-        # Get pre-computed possible values for this cell
-        possible_values = list(self.board.get_cell(row, col).possible_values)
+        A naked single is an empty cell down to one candidate; a hidden
+        single is a digit that fits only one cell of a row, column or
+        subgrid. Chains of forced moves run here instead of costing one
+        search level per move. The naked-singles scan also checks for cells
+        without candidates and tracks the cell with the fewest candidates
+        (MRV), so the search does not need separate passes for them.
         
-        # Try each possible value for this cell
-        for value in possible_values:
-            # Place the value - we don't need to check is_safe since possible_values
-            # already contains only valid values for this cell
-            self.board.set_value(row, col, value)
+        Args:
+            forced (list): Receives (row, col, value) for every placement,
+                so the caller can undo them when it backtracks
             
-            # Update constraints for affected cells
-            self.board.update_possible_values()
+        Returns:
+            int or None: Flat position (row * size + col) of the empty cell
+                         with the fewest candidates, -1 if no empty cell is
+                         left, or None if an empty cell was left without
+                         candidates or a unit has no place left for one of
+                         its digits
+        """
+        board = self.board
+        size = board.size
+        values = board._values
+        candidates = board._candidates
+        positions = board._positions
+        row_used = board._row_used
+        col_used = board._col_used
+        box_used = board._box_used
+        box_of = board._box_of
+        full_mask = board._full_mask
+        units = _get_units(size, board.subgrid_size)
+        while True:
+            # Naked singles, until a pass places nothing. Candidates are
+            # refreshed one cell at a time, so they already reflect the
+            # singles placed earlier in the pass; the last pass sees every
+            # mask current and its fewest-candidates cell is the MRV pick.
+            changed = True
+            while changed:
+                changed = False
+                branch = -1
+                fewest = size + 1
+                for index in board._empty[:]:
+                    row, col = positions[index]
+                    mask = full_mask & ~(row_used[row] | col_used[col] | box_used[box_of[index]])
+                    candidates[index] = mask
+                    if not mask & (mask - 1):
+                        if not mask:
+                            return None
+                        value = mask.bit_length()
+                        board.try_place(row, col, value)
+                        forced.append((row, col, value))
+                        changed = True
+                    elif not changed:
+                        count = mask.bit_count()
+                        if count < fewest:
+                            fewest = count
+                            branch = index
             
-            # Recursively try to solve the rest of the board
-            if self._solve_backtracking():
-                return True
+            # Hidden singles. Every candidate mask is current when this pass
+            # starts and placements only shrink them, so a stale mask can
+            # hide a single but never invent one that is not a contradiction.
+            for unit in units:
+                once = more = filled = 0
+                for index in unit:
+                    value = values[index]
+                    if value:
+                        filled |= 1 << (value - 1)
+                    else:
+                        mask = candidates[index]
+                        more |= once & mask
+                        once |= mask
+                if once | filled != full_mask:
+                    return None
+                hidden = once & ~more & ~filled
+                while hidden:
+                    bit = hidden & -hidden
+                    hidden ^= bit
+                    for index in unit:
+                        if not values[index] and candidates[index] & bit:
+                            break
+                    else:
+                        return None
+                    row, col = positions[index]
+                    value = bit.bit_length()
+                    if not board.try_place(row, col, value):
+                        return None
+                    forced.append((row, col, value))
+                    changed = True
             
-            # If failed, backtrack by removing the value
-            self.board.set_value(row, col, None)
-            self.board.update_possible_values()
-        
-        # No solution found with any value for this cell
-        return False
+            if not changed:
+                return branch
     
     def print_solution(self):
         """
@@ -167,5 +342,6 @@ class SudokuSolver:
             "solution_count": self.solution_count,
             "solve_time": self.solve_time,
             "iterations": self.iterations,
+            "backtrack_count": self.backtrack_count,
             "profile_data": self.profile_data
         }
\ No newline at end of file
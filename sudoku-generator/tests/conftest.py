@@ -0,0 +1,83 @@
+"""
+Shared pytest fixtures for the Sudoku Generator test suite.
+"""
+import importlib
+import os
+import sys
+
+import pytest
+from src.sudoku.board import Board
+from src.sudoku.generator import SudokuGenerator
+
+
+def pytest_addoption(parser):
+    """Add the --runslow option for tests marked as slow."""
+    parser.addoption("--runslow", action="store_true", default=False,
+                     help="run tests marked as slow")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked as slow unless --runslow is given."""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test: use --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def _shared_board9():
+    """A single 9x9 board allocated once for the whole test session."""
+    return Board(9)
+
+
+@pytest.fixture
+def board9(_shared_board9):
+    """
+    An empty 9x9 board.
+    
+    The same Board instance is handed to every test and reset afterwards,
+    so tests get a clean board without rebuilding it each time.
+    """
+    yield _shared_board9
+    _shared_board9.reset()
+
+
+@pytest.fixture(scope="session")
+def make_puzzle_4x4():
+    """
+    Factory for generated 4x4 puzzles.
+    
+    Each clue count is generated once per session and every call returns a
+    fresh copy, so tests that only consume a puzzle can change it freely
+    without paying for generation again.
+    
+    Returns:
+        callable: make(num_clues=None) -> Board
+    """
+    puzzles = {}
+    
+    def make(num_clues=None):
+        if num_clues not in puzzles:
+            puzzles[num_clues] = SudokuGenerator(4).generate_puzzle(num_clues=num_clues)
+        return puzzles[num_clues].copy()
+    
+    return make
+
+
+@pytest.fixture(scope="session")
+def import_example():
+    """
+    Importer for the scripts in the examples directory.
+    
+    The examples directory is put on sys.path only when a test asks for this
+    fixture, so collecting the suite does not import the example scripts.
+    
+    Returns:
+        callable: import_example(name) -> module
+    """
+    examples_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'examples'))
+    if examples_dir not in sys.path:
+        sys.path.insert(0, examples_dir)
+    return importlib.import_module
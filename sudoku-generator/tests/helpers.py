@@ -0,0 +1,18 @@
+"""
+Helper functions shared by the Sudoku Generator tests.
+"""
+
+
+def count_clues(board):
+    """
+    Count the filled cells on a board.
+    
+    Args:
+        board (Board): The board to inspect
+        
+    Returns:
+        int: Number of cells holding a value, counted cell by cell so the
+             board's own empty-cell bookkeeping is checked, not trusted
+    """
+    return sum(1 for row in range(board.size) for col in range(board.size)
+               if board.get_value(row, col) is not None)
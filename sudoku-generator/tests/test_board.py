@@ -1,8 +1,14 @@
 """
 Tests for the Board class.
 """
+import copy
+import pickle
+import random
+
 import pytest
 from src.sudoku.board import Board
+from src.sudoku.cell import Cell
+from tests.helpers import count_clues
 
 def test_board_initialization_valid_sizes():
     """Test board initialization with valid sizes."""
@@ -37,10 +43,21 @@ def test_board_initialization_invalid_sizes():
     
     with pytest.raises(ValueError):
         Board(10)
+    
+    # One more than a large perfect square must still be rejected
+    with pytest.raises(ValueError):
+        Board(4097)
+    
+    # Perfect squares whose digits do not fit in a byte are rejected too
+    with pytest.raises(ValueError):
+        Board(256)
+    
+    with pytest.raises(ValueError):
+        Board(0)
 
-def test_get_set_cell_values():
+def test_get_set_cell_values(board9):
     """Test getting and setting cell values."""
-    board = Board(9)
+    board = board9
     
     # Test setting values
     board.set_value(0, 0, 5)
@@ -61,18 +78,80 @@ def test_get_set_cell_values():
     board.set_value(0, 0, None)
     assert board.get_value(0, 0) is None
 
-def test_get_cell():
+def test_from_grid():
+    """Test building a board from a grid of values."""
+    grid = [
+        [1, None, None, 4],
+        [None, 4, 1, None],
+        [2, None, None, 3],
+        [None, 3, 2, None],
+    ]
+    board = Board.from_grid(grid)
+    
+    assert type(board) is Board
+    assert [[board.get_value(r, c) for c in range(4)] for r in range(4)] == grid
+    assert board.get_empty_count() == 8
+    assert board.is_valid() is True
+    
+    # Possible values are already updated from the loaded clues
+    assert board.get_cell(0, 1).possible_values == {2}
+    
+    # Ragged grids, invalid sizes and out-of-range values are rejected
+    with pytest.raises(ValueError):
+        Board.from_grid([[1, 2, 3, 4], [None] * 3, [None] * 4, [None] * 4])
+    with pytest.raises(ValueError):
+        Board.from_grid([[None] * 3] * 3)
+    with pytest.raises(ValueError):
+        Board.from_grid([[5, None, None, None]] + [[None] * 4] * 3)
+
+def test_get_cell(board9):
     """Test getting cell objects."""
-    board = Board(9)
+    board = board9
     board.set_value(1, 1, 5)
     
     cell = board.get_cell(1, 1)
     assert cell.get_value() == 5
     assert cell.get_position() == (1, 1)
+    assert str(cell) == "5"
+    
+    # The view stores only its position and board; the state stays on the board
+    assert not hasattr(cell, '_masks')
+    assert not hasattr(cell, '__dict__')
 
-def test_out_of_bounds_access():
-    """Test error handling for out-of-bounds access."""
+def test_get_cell_copy(board9):
+    """Test copying a cell view gives a standalone Cell detached from the board."""
+    board = board9
+    board.set_value(0, 1, 4)
+    board.update_possible_values()
+    
+    detached = board.get_cell(0, 0).copy()
+    assert isinstance(detached, Cell)
+    assert detached.get_position() == (0, 0)
+    assert detached.value is None
+    assert detached.possible_values == board.get_cell(0, 0).possible_values
+    assert 4 not in detached.possible_values
+    
+    # Changes to the copy stay off the board
+    detached.set_value(7)
+    assert board.get_value(0, 0) is None
+    assert board.get_cell(0, 1).copy().value == 4
+
+def test_get_subgrid_origin():
+    """Test looking up the top-left cell of a cell's subgrid."""
     board = Board(9)
+    assert board.get_subgrid_origin(0, 0) == (0, 0)
+    assert board.get_subgrid_origin(4, 7) == (3, 6)
+    assert board.get_subgrid_origin(8, 2) == (6, 0)
+    
+    board_16 = Board(16)
+    assert board_16.get_subgrid_origin(5, 13) == (4, 12)
+    
+    with pytest.raises(IndexError):
+        board.get_subgrid_origin(9, 0)
+
+def test_out_of_bounds_access(board9):
+    """Test error handling for out-of-bounds access."""
+    board = board9
     
     with pytest.raises(IndexError):
         board.get_value(-1, 5)
@@ -92,9 +171,9 @@ def test_out_of_bounds_access():
     with pytest.raises(IndexError):
         board.get_cell(9, 9)
 
-def test_invalid_values():
+def test_invalid_values(board9):
     """Test error handling for invalid values."""
-    board = Board(9)
+    board = board9
     
     with pytest.raises(ValueError):
         board.set_value(0, 0, 0)  # Too small
@@ -106,9 +185,9 @@ def test_invalid_values():
     board.set_value(0, 0, None)
     assert board.get_value(0, 0) is None
 
-def test_is_empty():
+def test_is_empty(board9):
     """Test is_empty method."""
-    board = Board(9)
+    board = board9
     
     # All cells should be empty initially
     assert board.is_empty(0, 0) is True
@@ -155,6 +234,63 @@ def test_get_empty_positions():
     assert (0, 1) in empty_positions
     assert (1, 0) in empty_positions
 
+def test_get_empty_positions_list():
+    """Test that empty positions are a row-major list snapshot callers may modify."""
+    board = Board(4)
+    board.set_value(0, 1, 2)
+    board.set_value(2, 0, 3)
+    
+    empty_positions = board.get_empty_positions()
+    expected = [(r, c) for r in range(4) for c in range(4) if (r, c) not in ((0, 1), (2, 0))]
+    assert type(empty_positions) is list
+    assert empty_positions == expected
+    
+    # Callers may shuffle or extend the list without touching the board
+    random.shuffle(empty_positions)
+    empty_positions.append((0, 1))
+    assert board.get_empty_positions() == expected
+    
+    # Later board changes do not alter an earlier snapshot
+    board.set_value(0, 0, 1)
+    assert (0, 0) in empty_positions
+    assert (0, 0) not in board.get_empty_positions()
+
+def test_get_empty_count():
+    """Test that the empty count tracks fills, clears and resets."""
+    board = Board(4)
+    assert board.get_empty_count() == 16
+    
+    board.set_value(0, 0, 1)
+    board.set_value(1, 1, 2)
+    assert board.get_empty_count() == 14
+    
+    # Overwriting a filled cell does not change the count
+    board.set_value(0, 0, 3)
+    assert board.get_empty_count() == 14
+    
+    board.set_value(0, 0, None)
+    assert board.get_empty_count() == 15
+    assert board.get_empty_count() == len(board.get_empty_positions())
+    
+    board.reset()
+    assert board.get_empty_count() == 16
+
+def test_reset():
+    """Test that reset clears values and constraints."""
+    board = Board(4)
+    board.set_value(0, 0, 1)
+    board.set_value(0, 1, 1)  # Duplicate in the same row
+    board.update_possible_values()
+    assert board.is_valid() is False
+    
+    board.reset()
+    
+    # Every cell should be empty again with all values possible
+    assert len(board.get_empty_positions()) == 16
+    assert board.get_cell(0, 2).possible_values == {1, 2, 3, 4}
+    assert board.is_valid() is True
+    assert board.is_safe(0, 2, 1) is True
+
 def test_string_representation():
     """Test string representation with grid lines."""
     board = Board(4)  # 4x4 board for clearer visualization
@@ -185,6 +321,68 @@ def test_string_representation():
             break
     assert has_separator
 
+def test_string_representation_tracks_changes():
+    """Test that the string representation follows every kind of update."""
+    board = Board(4)
+    empty_str = str(board)
+    
+    board.set_value(0, 0, 1)
+    assert str(board).split("\n")[0].startswith("1")
+    
+    assert board.try_place(3, 3, 2)
+    assert str(board).split("\n")[-1].endswith("2")
+    
+    board.undo(3, 3, 2)
+    board.set_value(0, 0, None)
+    assert str(board) == empty_str
+
+def test_try_place_filled_cell():
+    """Test try_place refuses a filled cell and leaves the board untouched."""
+    board = Board(4)
+    board.set_value(0, 0, 1)
+    empty_before = board.get_empty_positions()
+    
+    assert board.try_place(0, 0, 2) is False
+    assert board.get_value(0, 0) == 1
+    assert board.get_empty_count() == 15
+    assert board.get_empty_positions() == empty_before
+    
+    # Clearing the cell frees its digit again
+    board.set_value(0, 0, None)
+    assert board.is_safe(0, 1, 1)
+    assert board.is_safe(0, 1, 2)
+
+def test_undo_misuse():
+    """Test undo only reverts a value the cell actually holds."""
+    board = Board(4)
+    assert board.try_place(0, 0, 1)
+    board.undo(0, 0, 1)
+    
+    # A second undo of the same placement, or a wrong value, is rejected
+    with pytest.raises(ValueError):
+        board.undo(0, 0, 1)
+    board.set_value(1, 1, 2)
+    with pytest.raises(ValueError):
+        board.undo(1, 1, 3)
+    with pytest.raises(IndexError):
+        board.undo(4, 0, 1)
+    
+    assert board.get_empty_count() == 15
+    assert board.get_value(1, 1) == 2
+    assert board.is_safe(0, 0, 1)
+    assert board.is_valid()
+
+def test_undo_with_duplicates():
+    """Test undo keeps a duplicated digit's bit while another cell holds it."""
+    board = Board(4)
+    board.set_value(0, 0, 1)
+    board.set_value(0, 3, 1)  # Duplicate in row 0
+    
+    board.undo(0, 3, 1)
+    assert board.is_valid()
+    assert not board.is_safe(0, 1, 1)
+    assert board.get_empty_count() == 15
+
 def test_print_grid(capsys: pytest.CaptureFixture[str]):
     """Test print_grid method."""
     board = Board(4)
@@ -202,25 +400,25 @@ def test_print_grid(capsys: pytest.CaptureFixture[str]):
     # Should match the string representation
     assert captured.out.strip() == str(board).strip()
 
-def test_is_safe_row_constraint():
+def test_is_safe_row_constraint(board9):
     """Test is_safe method for row constraint."""
-    board = Board(9)
+    board = board9
     board.set_value(0, 0, 5)
     
     # Same row should fail
     assert board.is_safe(0, 1, 5) is False
     
-def test_is_safe_column_constraint():
+def test_is_safe_column_constraint(board9):
     """Test is_safe method for column constraint."""
-    board = Board(9)
+    board = board9
     board.set_value(0, 0, 5)
     
     # Same column should fail
     assert board.is_safe(1, 0, 5) is False
     
-def test_is_safe_subgrid_constraint():
+def test_is_safe_subgrid_constraint(board9):
     """Test is_safe method for subgrid constraint."""
-    board = Board(9)  # 3x3 subgrids
+    board = board9  # 3x3 subgrids
     board.set_value(0, 0, 5)
     
     # Same subgrid should fail
@@ -229,18 +427,18 @@ def test_is_safe_subgrid_constraint():
     # Different subgrid should pass
     assert board.is_safe(3, 3, 5) is True
 
-def test_is_safe_empty_position():
+def test_is_safe_empty_position(board9):
     """Test is_safe method on an empty board."""
-    board = Board(9)
+    board = board9
     
     # Empty board should allow any valid placement
     assert board.is_safe(4, 4, 5) is True
     assert board.is_safe(0, 0, 1) is True
     assert board.is_safe(8, 8, 9) is True
 
-def test_is_safe_invalid_inputs():
+def test_is_safe_invalid_inputs(board9):
     """Test is_safe method with invalid inputs."""
-    board = Board(9)
+    board = board9
     
     # Out of bounds positions
     with pytest.raises(IndexError):
@@ -256,9 +454,9 @@ def test_is_safe_invalid_inputs():
     with pytest.raises(ValueError):
         board.is_safe(0, 0, 10)
 
-def test_is_valid_empty_board():
+def test_is_valid_empty_board(board9):
     """Test is_valid method on an empty board."""
-    board = Board(9)
+    board = board9
     
     # Empty board should be valid
     assert board.is_valid() is True
@@ -332,6 +530,26 @@ def test_is_valid_multiple_violations():
     
     assert board.is_valid() is False
 
+def test_clearing_duplicate_keeps_constraints():
+    """Test that clearing one copy of a duplicated digit keeps the other in force."""
+    board = Board(4)
+    board.set_value(0, 0, 1)
+    board.set_value(0, 1, 1)  # Row violation
+    board.set_value(1, 0, 1)  # Column and subgrid violation
+    
+    # Removing one copy leaves the digit present in the row, column and subgrid
+    board.set_value(0, 0, None)
+    assert board.is_valid() is False
+    assert board.is_safe(0, 3, 1) is False  # Still in row 0 via (0, 1)
+    assert board.is_safe(3, 0, 1) is False  # Still in column 0 via (1, 0)
+    assert board.is_safe(1, 1, 1) is False  # Still in the top-left subgrid
+    
+    # Removing the last duplicate makes the board valid again
+    board.set_value(0, 1, None)
+    assert board.is_valid() is True
+    assert board.is_safe(0, 3, 1) is True
+    assert board.is_safe(3, 0, 1) is False
+
 def test_update_possible_values_single_cell():
     """Test updating possible values for a single cell."""
     board = Board(4)  # 4x4 board for simplicity
@@ -602,6 +820,27 @@ def test_board_copy_different_states():
         for c in range(4):
             assert full_copy.get_value(r, c) == full.get_value(r, c)
 
+def test_board_pickle_round_trip():
+    """Test that pickling and the copy module rebuild an independent board."""
+    original = Board(9)
+    original.set_value(0, 0, 1)
+    original.set_value(4, 4, 5)
+    original.set_value(0, 1, 1)  # Duplicate in the same row
+    original.update_possible_values()
+    
+    for restored in (pickle.loads(pickle.dumps(original)),
+                     copy.copy(original), copy.deepcopy(original)):
+        assert type(restored) is Board
+        assert str(restored) == str(original)
+        assert restored.is_valid() is False
+        assert restored.get_empty_positions() == original.get_empty_positions()
+        assert restored.get_cell(0, 2).possible_values == original.get_cell(0, 2).possible_values
+        
+        # The restored board has its own buffers
+        restored.set_value(0, 1, None)
+        assert restored.is_valid() is True
+        assert original.get_value(0, 1) == 1
+
 def test_get_mrv_cell_basic():
     """Test MRV finds cell with fewest options."""
     board = Board(4)
@@ -688,6 +927,18 @@ def test_get_mrv_cell_one_possibility():
     assert len(board.get_cell(1, 3).possible_values) == 1
     assert 2 in board.get_cell(1, 3).possible_values
 
+def test_get_mrv_cell_dead_end():
+    """Test MRV returns a cell without candidates so the solver can fail fast."""
+    board = Board(4)
+    board.set_value(0, 1, 1)
+    board.set_value(0, 2, 2)
+    board.set_value(1, 0, 3)
+    board.set_value(2, 0, 4)
+    
+    # Row 0 rules out 1 and 2 and column 0 rules out 3 and 4
+    assert board.get_mrv_cell() == (0, 0)
+    assert len(board.get_cell(0, 0).possible_values) == 0
+
 def test_get_mrv_cell_different_board_sizes():
     """Test MRV works with different board sizes."""
     # Test with a 4x4 board
@@ -768,6 +1019,19 @@ def test_count_solutions_max_count():
     assert solutions1 <= 1
     assert solutions2 <= 5
 
+def test_count_solutions_exhaustive():
+    """Test an exact count over the whole search tree."""
+    board = Board(4)
+    
+    # An empty 4x4 board has exactly 288 solutions
+    assert board.count_solutions(max_count=1000) == 288
+    assert board.count_solutions(max_count=288) == 288
+    assert board.count_solutions(max_count=0) == 0
+    
+    # The search works on its own masks and leaves the board untouched
+    assert board.get_empty_count() == 16
+    assert board.is_valid() is True
+
 def test_remove_clues():
     """Test removing clues while maintaining uniqueness."""
     # Create a small board for faster testing
@@ -792,9 +1056,6 @@ def test_remove_clues():
     # Verify board is valid
     assert board.is_valid()
     
-    # Count clues before removal
-    filled_before = 16  # 4x4 complete board
-    
     # Try to remove clues, keeping 10 clues
     target_clues = 10
     success = board.remove_clues(target_clues)
@@ -803,8 +1064,7 @@ def test_remove_clues():
     assert success is True
     
     # Count remaining clues
-    remaining_clues = sum(1 for row in range(4) for col in range(4) 
-                         if board.get_value(row, col) is not None)
+    remaining_clues = count_clues(board)
     
     # Verify we have exactly the target number of clues
     assert remaining_clues == target_clues
@@ -812,6 +1072,18 @@ def test_remove_clues():
     # Verify board still has a unique solution
     assert board.count_solutions() == 1
 
+def test_remove_clues_keeps_ambiguous_board():
+    """Test that no clue is removed from a board that is already ambiguous."""
+    board = Board(4)
+    board.set_value(0, 0, 1)
+    board.set_value(1, 2, 1)
+    board.set_value(2, 1, 2)
+    assert board.count_solutions() == 2
+    
+    # Every removal leaves at least two solutions, so all are rejected
+    assert board.remove_clues(1) is False
+    assert board.get_empty_count() == 13
+
 def test_unique_solution_after_removal():
     """Test that removing clues maintains a unique solution."""
     # Create a small board with a unique solution
@@ -843,8 +1115,7 @@ def test_unique_solution_after_removal():
             assert test_board.count_solutions() == 1
             
             # Count the actual number of clues
-            actual_clues = sum(1 for row in range(4) for col in range(4) 
-                             if test_board.get_value(row, col) is not None)
+            actual_clues = count_clues(test_board)
             
             # Verify we have the expected number of clues
             assert actual_clues == target_clues
@@ -874,11 +1145,7 @@ def test_efficiency_with_mrv():
     assert mrv_cell is not None
     
     # Count clues
-    clues = 0
-    for row in range(4):
-        for col in range(4):
-            if board.get_value(row, col) is not None:
-                clues += 1
+    clues = count_clues(board)
     
     # Verify we have expected number of clues
     assert clues == 10
\ No newline at end of file
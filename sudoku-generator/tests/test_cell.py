@@ -5,20 +5,21 @@ Tests for the Cell class.
 import pytest
 from src.sudoku.cell import Cell
 
+# Every digit for a 9x9 and a 16x16 board
+FULL_9 = frozenset(range(1, 10))
+FULL_16 = frozenset(range(1, 17))
 
-def test_cell_initialization():
+
+@pytest.mark.parametrize("row,col,value", [
+    (1, 2, 5),     # Cell with a value
+    (3, 4, None),  # Cell without a value
+])
+def test_cell_initialization(row, col, value):
     """Test that a cell is initialized correctly."""
-    # Create a cell with a value
-    cell = Cell(1, 2, 5)
-    assert cell.row == 1
-    assert cell.col == 2
-    assert cell.get_value() == 5
-    
-    # Create a cell without a value
-    empty_cell = Cell(3, 4)
-    assert empty_cell.row == 3
-    assert empty_cell.col == 4
-    assert empty_cell.get_value() is None
+    cell = Cell(row, col, value)
+    assert cell.row == row
+    assert cell.col == col
+    assert cell.get_value() == value
 
 
 def test_cell_set_get_value():
@@ -56,42 +57,32 @@ def test_cell_string_representation():
     assert '3)' in repr(cell)
 
 
-def test_possible_values_initialization():
+@pytest.mark.parametrize("kwargs,expected", [
+    ({}, FULL_9),                                    # Default 9x9 board
+    ({"value": 5}, {5}),                             # Cell with a value
+    ({"possible_values": {1, 3, 5}}, {1, 3, 5}),     # Custom possible values
+    ({"possible_values": set()}, set()),             # Empty possible values
+    ({"board_size": 4}, {1, 2, 3, 4}),               # Smaller board size
+    ({"board_size": 16}, FULL_16),                   # Large board size
+], ids=["default", "value", "custom", "empty", "size4", "size16"])
+def test_possible_values_initialization(kwargs, expected):
     """Test initialization of possible values."""
-    # Default initialization for 9x9 board
-    cell = Cell(0, 0)
-    assert cell.possible_values == set(range(1, 10))
-    
-    # Initialization with a value
-    cell = Cell(0, 0, value=5)
-    assert cell.possible_values == {5}
-    
-    # Initialization with custom possible values
-    cell = Cell(0, 0, possible_values={1, 3, 5})
-    assert cell.possible_values == {1, 3, 5}
-    
-    # Initialization with different board size
-    cell = Cell(0, 0, board_size=4)
-    assert cell.possible_values == {1, 2, 3, 4}
+    cell = Cell(0, 0, **kwargs)
+    assert cell.possible_values == expected
 
 def test_set_value_updates_possible_values():
     """Test that setting a value updates possible values."""
     cell = Cell(0, 0, board_size=9)
-    assert cell.possible_values == set(range(1, 10))
+    assert cell.possible_values == FULL_9
     
     cell.set_value(5)
     assert cell.possible_values == {5}
 
-def test_get_position():
+@pytest.mark.parametrize("position", [(3, 7), (0, 0), (8, 8)])
+def test_get_position(position):
     """Test getting cell position."""
-    cell = Cell(3, 7)
-    assert cell.get_position() == (3, 7)
-    
-    cell = Cell(0, 0)
-    assert cell.get_position() == (0, 0)
-    
-    cell = Cell(8, 8)
-    assert cell.get_position() == (8, 8)
+    cell = Cell(*position)
+    assert cell.get_position() == position
 
 def test_cell_copy():
     """Test deep copying of cells."""
@@ -133,13 +124,41 @@ def test_cell_copy_with_no_value():
     assert 1 in original.possible_values
     assert 1 not in copy.possible_values
 
-def test_edge_cases():
-    """Test edge cases for possible values."""
-    # Empty possible values
-    cell = Cell(0, 0, possible_values=set())
-    assert cell.possible_values == set()
+def test_clear_value_resets_to_board_size():
+    """Test that clearing a value restores the possible values for the cell's board size."""
+    cell = Cell(0, 0, board_size=4)
+    cell.set_value(3)
+    assert cell.possible_values == {3}
     
-    # Large board size
-    cell = Cell(0, 0, board_size=16)
-    assert len(cell.possible_values) == 16
-    assert all(v in cell.possible_values for v in range(1, 17))
\ No newline at end of file
+    cell.set_value(None)
+    assert cell.possible_values == {1, 2, 3, 4}
+
+def test_possible_values_view():
+    """Test that possible values behave like a live, mutable set."""
+    cell = Cell(0, 0, possible_values={1, 3, 5})
+    view = cell.possible_values
+    
+    # Edits through a held view reach the cell, and vice versa
+    view.remove(3)
+    assert cell.possible_values == {1, 5}
+    cell.set_value(7)
+    assert view == {7}
+    
+    # Set operators return detached plain sets
+    view.add(2)
+    assert view | {9} == {2, 7, 9}
+    assert isinstance(view - {7}, set)
+    assert sorted(view) == [2, 7]
+    
+    with pytest.raises(KeyError):
+        view.remove(4)
+
+def test_num_possible():
+    """Test counting possible values."""
+    assert Cell(0, 0).num_possible() == 9
+    assert Cell(0, 0, board_size=16).num_possible() == 16
+    assert Cell(0, 0, value=5).num_possible() == 1
+    
+    cell = Cell(0, 0, possible_values={2, 4, 6})
+    cell.possible_values.discard(4)
+    assert cell.num_possible() == 2
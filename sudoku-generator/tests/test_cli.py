@@ -19,92 +19,102 @@ from src.sudoku.cli import (
     generate_puzzle,
     main
 )
+from src.sudoku import cli
 from src.sudoku.board import Board
 
+
+def _patch_cli(monkeypatch, *names):
+    """
+    Replace CLI module attributes with fresh MagicMocks.
+    
+    Args:
+        monkeypatch: The pytest monkeypatch fixture
+        *names (str): Names of the src.sudoku.cli attributes to replace
+        
+    Returns:
+        tuple: The mocks, in the order of names
+    """
+    mocks = tuple(MagicMock() for _ in names)
+    for name, mock in zip(names, mocks):
+        monkeypatch.setattr(cli, name, mock)
+    return mocks
+
+
+# Sample 4x4 puzzle with two clues, and a filled grid used as its solution
+PUZZLE_GRID = [[1, None, None, None], [None, 2, None, None], [None] * 4, [None] * 4]
+SOLUTION_GRID = [[(row + col) % 4 + 1 for col in range(4)] for row in range(4)]
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """The CLI argument parser, built once for the module."""
+    return setup_argparse()
+
+
+@pytest.fixture(scope="module")
+def sample_boards():
+    """
+    A 4x4 puzzle with two clues and a filled 4x4 solution board.
+    
+    Shared by the format_output tests, which only read them.
+    """
+    board = Board.from_grid(PUZZLE_GRID)
+    solution = Board.from_grid(SOLUTION_GRID)
+    return board, solution
+
+
 class TestCLI:
     """Tests for the CLI module."""
     
-    def test_argparse_setup(self):
+    def test_argparse_setup(self, parser):
         """Test that argparse is set up correctly."""
-        parser = setup_argparse()
         assert isinstance(parser, argparse.ArgumentParser)
-        
-        # Test with default arguments
-        args = parser.parse_args([])
-        assert args.size == 9
-        assert args.clues is None
-        assert args.format == "text"
-        assert args.output is None
-        assert not args.solve
-        assert not args.stats
-        assert args.verbose == 0
-        assert not args.quiet
-        
-        # Test with custom arguments
-        args = parser.parse_args([
-            "--size", "4",
-            "--clues", "7",
-            "--format", "json",
-            "--output", "output.json",
-            "--solve",
-            "--stats",
-            "-vv",
-            "--quiet"
-        ])
-        assert args.size == 4
-        assert args.clues == 7
-        assert args.format == "json"
-        assert args.output == "output.json"
-        assert args.solve
-        assert args.stats
-        assert args.verbose == 2
-        assert args.quiet
     
-    @patch('src.sudoku.cli.logging.getLogger')
-    def test_configure_logging(self, mock_get_logger):
+    @pytest.mark.parametrize("argv,expected", [
+        # Default arguments
+        ([], {
+            "size": 9, "clues": None, "format": "text", "output": None,
+            "solve": False, "stats": False, "verbose": 0, "quiet": False,
+        }),
+        # Custom arguments
+        (["--size", "4", "--clues", "7", "--format", "json", "--output", "output.json",
+          "--solve", "--stats", "-vv", "--quiet"], {
+            "size": 4, "clues": 7, "format": "json", "output": "output.json",
+            "solve": True, "stats": True, "verbose": 2, "quiet": True,
+        }),
+    ], ids=["defaults", "custom"])
+    def test_argparse_arguments(self, parser, argv, expected):
+        """Test parsing default and custom arguments."""
+        args = parser.parse_args(argv)
+        for name, value in expected.items():
+            assert getattr(args, name) == value, name
+    
+    def test_configure_logging(self, monkeypatch):
         """Test that logging is configured correctly."""
-        # Set up mock loggers that will be returned by logging.getLogger
-        mock_sudoku_logger = MagicMock()
-        mock_cli_logger = MagicMock()
-        
-        # Configure the mock to return our mock loggers
-        # This patches the getLogger function to return our mocks based on the name
-        mock_get_logger.side_effect = lambda name: {
-            "sudoku": mock_sudoku_logger,
-            "sudoku.cli": mock_cli_logger
-        }.get(name, MagicMock())
+        # configure_logging() looks up a single logger, so getLogger can
+        # return one fixed mock
+        sudoku_logger = MagicMock()
+        get_logger = MagicMock(return_value=sudoku_logger)
+        monkeypatch.setattr(cli.logging, "getLogger", get_logger)
         
         # Test with default verbosity (INFO)
-        args = argparse.Namespace(verbose=0, quiet=False)
-        configure_logging(args)
-        mock_sudoku_logger.setLevel.assert_called_once_with(logging.INFO)
-        # Reset mocks for next test
-        mock_sudoku_logger.reset_mock()
+        configure_logging(argparse.Namespace(verbose=0, quiet=False))
+        get_logger.assert_called_once_with("sudoku")
+        sudoku_logger.setLevel.assert_called_once_with(logging.INFO)
+        sudoku_logger.setLevel.reset_mock()
         
         # Test with increased verbosity (DEBUG)
-        args = argparse.Namespace(verbose=1, quiet=False)
-        configure_logging(args)
-        mock_sudoku_logger.setLevel.assert_called_once_with(logging.DEBUG)
-        # Reset mocks for next test
-        mock_sudoku_logger.reset_mock()
+        configure_logging(argparse.Namespace(verbose=1, quiet=False))
+        sudoku_logger.setLevel.assert_called_once_with(logging.DEBUG)
+        sudoku_logger.setLevel.reset_mock()
         
         # Test with quiet mode (ERROR)
-        args = argparse.Namespace(verbose=0, quiet=True)
-        configure_logging(args)
-        mock_sudoku_logger.setLevel.assert_called_once_with(logging.ERROR)
+        configure_logging(argparse.Namespace(verbose=0, quiet=True))
+        sudoku_logger.setLevel.assert_called_once_with(logging.ERROR)
     
-    def test_format_output_text(self):
+    def test_format_output_text(self, sample_boards):
         """Test formatting output as text."""
-        # Create a simple board for testing
-        board = Board(4)
-        board.set_value(0, 0, 1)
-        board.set_value(1, 1, 2)
-        
-        # Create a solution board
-        solution = Board(4)
-        for row in range(4):
-            for col in range(4):
-                solution.set_value(row, col, (row + col) % 4 + 1)
+        board, solution = sample_boards
         
         # Create sample stats
         stats = {
@@ -140,18 +150,9 @@ class TestCLI:
         assert "SOLUTION:" in output
         assert "STATISTICS:" in output
     
-    def test_format_output_csv(self):
+    def test_format_output_csv(self, sample_boards):
         """Test formatting output as CSV."""
-        # Create a simple board for testing
-        board = Board(4)
-        board.set_value(0, 0, 1)
-        board.set_value(1, 1, 2)
-        
-        # Create a solution board
-        solution = Board(4)
-        for row in range(4):
-            for col in range(4):
-                solution.set_value(row, col, (row + col) % 4 + 1)
+        board, solution = sample_boards
         
         # Test without solution
         output = format_output(board, None, None, "csv")
@@ -166,18 +167,9 @@ class TestCLI:
         assert len(lines) == 9  # 4 rows for puzzle + empty line + 4 rows for solution
         assert lines[5] == "1,2,3,4"  # First row of solution
     
-    def test_format_output_json(self):
+    def test_format_output_json(self, sample_boards):
         """Test formatting output as JSON."""
-        # Create a simple board for testing
-        board = Board(4)
-        board.set_value(0, 0, 1)
-        board.set_value(1, 1, 2)
-        
-        # Create a solution board
-        solution = Board(4)
-        for row in range(4):
-            for col in range(4):
-                solution.set_value(row, col, (row + col) % 4 + 1)
+        board, solution = sample_boards
         
         # Create sample stats
         stats = {
@@ -227,10 +219,10 @@ class TestCLI:
         mock_open.assert_called_once_with("output.txt", "w")
         mock_file.write.assert_called_once_with("test output")
     
-    @patch('src.sudoku.cli.SudokuGenerator')
-    def test_generate_puzzle(self, mock_generator_class):
+    def test_generate_puzzle(self, monkeypatch):
         """Test generating a puzzle."""
         # Set up mocks
+        mock_generator_class, = _patch_cli(monkeypatch, "SudokuGenerator")
         mock_generator = MagicMock()
         mock_generator_class.return_value = mock_generator
         
@@ -292,15 +284,13 @@ class TestCLI:
         assert solution == mock_solution.copy.return_value
         assert stats is not None
     
-    @patch('src.sudoku.cli.setup_argparse')
-    @patch('src.sudoku.cli.configure_logging')
-    @patch('src.sudoku.cli.generate_puzzle')
-    @patch('src.sudoku.cli.format_output')
-    @patch('src.sudoku.cli.write_output')
-    def test_main(self, mock_write_output, mock_format_output, mock_generate_puzzle, 
-                 mock_configure_logging, mock_setup_argparse):
+    def test_main(self, monkeypatch):
         """Test the main function."""
         # Set up mocks
+        (mock_setup_argparse, mock_configure_logging, mock_generate_puzzle,
+         mock_format_output, mock_write_output) = _patch_cli(
+            monkeypatch, "setup_argparse", "configure_logging", "generate_puzzle",
+            "format_output", "write_output")
         mock_parser = MagicMock()
         mock_args = MagicMock()
         mock_puzzle = MagicMock()
@@ -333,13 +323,12 @@ class TestCLI:
         # Check that main returned 0 (success)
         assert result == 0
 
-    @patch('sys.argv', ['sudoku_cli.py', '--size', '4', '--clues', '7'])
-    @patch('src.sudoku.cli.generate_puzzle')
-    @patch('src.sudoku.cli.format_output')
-    @patch('src.sudoku.cli.write_output')
-    def test_main_integration(self, mock_write_output, mock_format_output, mock_generate_puzzle):
+    def test_main_integration(self, monkeypatch):
         """Test the main function with command line arguments."""
         # Set up mocks
+        monkeypatch.setattr(sys, "argv", ['sudoku_cli.py', '--size', '4', '--clues', '7'])
+        mock_generate_puzzle, mock_format_output, mock_write_output = _patch_cli(
+            monkeypatch, "generate_puzzle", "format_output", "write_output")
         mock_puzzle = MagicMock()
         mock_solution = MagicMock()
         mock_stats = MagicMock()
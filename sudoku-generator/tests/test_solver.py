@@ -5,6 +5,46 @@ import pytest
 from src.sudoku.board import Board
 from src.sudoku.solver import SudokuSolver
 
+# A simple 9×9 puzzle with a unique solution, as (row, col, value) clues
+SIMPLE_9X9_CLUES = (
+    (0, 0, 5), (0, 1, 3), (0, 4, 7),
+    (1, 0, 6), (1, 3, 1), (1, 4, 9), (1, 5, 5),
+    (2, 1, 9), (2, 2, 8), (2, 7, 6),
+    (3, 0, 8), (3, 4, 6), (3, 8, 3),
+    (4, 0, 4), (4, 3, 8), (4, 5, 3), (4, 8, 1),
+    (5, 0, 7), (5, 4, 2), (5, 8, 6),
+    (6, 1, 6), (6, 6, 2), (6, 7, 8),
+    (7, 3, 4), (7, 4, 1), (7, 5, 9), (7, 8, 5),
+    (8, 4, 8), (8, 7, 7), (8, 8, 9),
+)
+
+# A hard 9×9 puzzle in row-major order, 0 for empty, that propagation alone
+# cannot finish
+HARD_9X9 = "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+
+# Minimum-clue 9×9 puzzles, each with 17 clues and a unique solution
+SEVENTEEN_CLUE_PUZZLES = (
+    "000000010400000000020000000000050407008000300001090000300400200050100000000806000",
+    "000000012000035000000600070700000300000400800100000000000120000080000040050000600",
+    "000000012003600000000007000410020000000500300700000600280000040000300500000000000",
+    "000000012008030000000000040120500000000004700060000000507000300000620000000100000",
+    "000000013000030080070000000000206000030000900000010000600500204000400700100000000",
+)
+
+def _board_from_string(puzzle):
+    """Build a 9×9 board from an 81-character puzzle string."""
+    return Board.from_grid([[int(ch) or None for ch in puzzle[row * 9:(row + 1) * 9]]
+                            for row in range(9)])
+
+@pytest.fixture(scope="module")
+def simple_9x9_board():
+    """The simple 9×9 puzzle, built once per module; tests should copy it."""
+    board = Board(9)
+    for row, col, value in SIMPLE_9X9_CLUES:
+        board.set_value(row, col, value)
+    board.update_possible_values()
+    return board
+
 def test_solver_initialization():
     """Test solver initialization."""
     solver = SudokuSolver()
@@ -99,29 +139,10 @@ def test_solve_simple_4x4():
     # Verify the solution is valid
     assert solver.board.is_valid()
 
-def test_solve_simple_9x9():
+def test_solve_simple_9x9(simple_9x9_board):
     """Test solving a simple 9×9 puzzle."""
-    # Create a 9×9 board
-    board = Board(9)
-    
-    # Set up a simple puzzle with a unique solution
-    clues = [
-        (0, 0, 5), (0, 1, 3), (0, 4, 7),
-        (1, 0, 6), (1, 3, 1), (1, 4, 9), (1, 5, 5),
-        (2, 1, 9), (2, 2, 8), (2, 7, 6),
-        (3, 0, 8), (3, 4, 6), (3, 8, 3),
-        (4, 0, 4), (4, 3, 8), (4, 5, 3), (4, 8, 1),
-        (5, 0, 7), (5, 4, 2), (5, 8, 6),
-        (6, 1, 6), (6, 6, 2), (6, 7, 8),
-        (7, 3, 4), (7, 4, 1), (7, 5, 9), (7, 8, 5),
-        (8, 4, 8), (8, 7, 7), (8, 8, 9)
-    ]
-    
-    for row, col, value in clues:
-        board.set_value(row, col, value)
-    
-    # Update possible values
-    board.update_possible_values()
+    # Work on a copy so the shared puzzle stays untouched
+    board = simple_9x9_board.copy()
     
     # Create a solver
     solver = SudokuSolver()
@@ -136,8 +157,59 @@ def test_solve_simple_9x9():
     assert solver.board.is_valid()
     
     # Verify some of the original clues are preserved
-    for row, col, value in clues[:5]:  # Check first 5 clues
+    for row, col, value in SIMPLE_9X9_CLUES[:5]:  # Check first 5 clues
         assert solver.board.get_value(row, col) == value
+    
+    # An easy puzzle is finished by propagation alone, without guessing
+    assert solver.backtrack_count == 0
+
+def test_solve_hard_9x9():
+    """Test solving a 9×9 puzzle that needs backtracking."""
+    solver = SudokuSolver()
+    assert solver.solve(_board_from_string(HARD_9X9)) is True
+    assert solver.board.is_valid()
+    assert solver.board.get_empty_count() == 0
+    
+    # Guard against the search silently skipping its guesses
+    assert solver.backtrack_count > 0
+
+@pytest.mark.parametrize("puzzle", SEVENTEEN_CLUE_PUZZLES)
+def test_solve_17_clue(puzzle):
+    """Test solving minimum-clue 9×9 puzzles."""
+    solver = SudokuSolver()
+    assert solver.solve(_board_from_string(puzzle)) is True
+    assert solver.board.is_valid()
+    assert solver.board.get_empty_count() == 0
+    
+    # Every clue is kept in the solution
+    for index, ch in enumerate(puzzle):
+        if ch != "0":
+            assert solver.board.get_value(index // 9, index % 9) == int(ch)
+
+@pytest.mark.parametrize("max_solutions, expected", [(1, 1), (2, 2), (1000, 288)])
+def test_solve_max_solutions(max_solutions, expected):
+    """Test the search stops at max_solutions and keeps a full solution."""
+    # An empty 4×4 board has 288 solutions
+    solver = SudokuSolver()
+    assert solver.solve(Board(4), max_solutions=max_solutions) is True
+    assert solver.solution_count == expected
+    assert solver.board.get_empty_count() == 0
+    assert solver.board.is_valid()
+
+def test_solve_unique_check(simple_9x9_board):
+    """Test max_solutions=2 confirms a unique puzzle and keeps its solution."""
+    solver = SudokuSolver()
+    assert solver.solve(simple_9x9_board.copy()) is True
+    first = str(solver.board)
+    
+    assert solver.solve(simple_9x9_board.copy(), max_solutions=2) is True
+    assert solver.solution_count == 1
+    assert str(solver.board) == first
+
+def test_solve_invalid_max_solutions():
+    """Test max_solutions below 1 is rejected."""
+    with pytest.raises(ValueError):
+        SudokuSolver().solve(Board(4), max_solutions=0)
 
 def test_unsolvable_puzzle():
     """Test that the solver correctly identifies unsolvable puzzles."""